@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Answer-key index built from the textbooks' answer PDFs (lemh1an.pdf, leph1an.pdf).
+
+The answers are listed under "EXERCISE c.e", "Miscellaneous Exercise on
+Chapter c" or "CHAPTER c" headings, each as a question number ("3." in
+Mathematics, "1.3" in Physics) followed by its answer. build_answer_key()
+walks them once into a dict keyed by (chapter, exercise, number), so the
+extractors look a problem's answer up directly instead of guessing where its
+solution ends. The extractors track the same headings in the chapter PDFs to
+key their questions.
+"""
+
+import argparse
+import json
+import re
+import sys
+from functools import lru_cache
+from pathlib import Path
+from pdf_text import iter_pages
+
+# The answers PDF of each subject's Part 1 textbook.
+ANSWER_PDFS = {'lemh1an.pdf', 'leph1an.pdf'}
+
+_HEADINGS = (r'EXERCISE\s+(?P<exercise>\d+\.\d+)'
+             r'|Miscellaneous\s+Exercise\s+on\s+Chapter\s+(?P<misc>\d+)'
+             r'|CHAPTER\s+(?P<chapter>\d+)')
+
+HEADING_RE = re.compile(r'^[ \t]*(?:' + _HEADINGS + r')[ \t]*$', re.MULTILINE | re.IGNORECASE)
+
+# A heading, a Physics "c.n" number alone on its line, or a Mathematics "n."
+# at the start of a line or after a wide gap ("No      4. n!      5. Yes").
+ANSWER_TOKEN_RE = re.compile(
+    r'^[ \t]*(?:' + _HEADINGS + r')[ \t]*$'
+    r'|^[ \t]*(?P<section>\d+)\.(?P<item>\d+)[ \t]*$'
+    r'|(?:^|[ \t]{2,})(?P<number>\d+)\.(?=\s)',
+    re.MULTILINE | re.IGNORECASE)
+
+QUESTION_NUMBER_RE = re.compile(r'(?:Exercise\s+|Q|Problem\s+\d+\.)?(\d+)\b', re.IGNORECASE)
+PAGE_FURNITURE_RE = re.compile(r'^(?:ANSWERS|MATHEMATICS|PHYSICS|\d{1,4})$', re.IGNORECASE)
+REPRINT_RE = re.compile(r'^Reprint \d{4}-\d{2}$')
+SPACE_RE = re.compile(r'\s+')
+
+def heading_key(match):
+    """Return the (chapter, exercise) a heading match opens; exercise is '' for a bare chapter."""
+    if match.group('exercise'):
+        exercise = match.group('exercise')
+        return int(exercise.split('.')[0]), exercise
+    if match.group('misc'):
+        return int(match.group('misc')), 'misc'
+    return int(match.group('chapter')), ''
+
+def question_number(question):
+    """Return the number a question is labelled with ("3.", "Q3)", "Problem 1.3"), or None."""
+    match = QUESTION_NUMBER_RE.match(question)
+    return int(match.group(1)) if match else None
+
+def strip_page_furniture(text):
+    """Drop the running head, page number and reprint line around a page's text."""
+    lines = text.strip().split("\n")
+    while lines and PAGE_FURNITURE_RE.match(lines[0].strip()):
+        lines.pop(0)
+    while lines and REPRINT_RE.match(lines[-1].strip()):
+        lines.pop()
+    return "\n".join(lines)
+
+def build_answer_key(pages):
+    """Index streamed (page_number, text) pages of an answers PDF by (chapter, exercise, number)."""
+    text = "".join(strip_page_furniture(page) + "\n" for _, page in pages)
+    answers = {}
+    section = None  # (chapter, exercise) of the latest heading
+    key = None
+    start = 0
+    for token in ANSWER_TOKEN_RE.finditer(text):
+        if key is not None:
+            answers.setdefault(key, SPACE_RE.sub(' ', text[start:token.start()]).strip())
+        key = None
+        start = token.end()
+        if token.group('chapter') or token.group('exercise') or token.group('misc'):
+            section = heading_key(token)
+        elif section is None:
+            continue
+        elif token.group('section'):
+            # Physics numbers its answers chapter.question under a CHAPTER heading.
+            if int(token.group('section')) == section[0] and section[1] == '':
+                key = (section[0], '', int(token.group('item')))
+        else:
+            key = (*section, int(token.group('number')))
+    if key is not None:
+        answers.setdefault(key, SPACE_RE.sub(' ', text[start:]).strip())
+    return {key: answer for key, answer in answers.items() if answer}
+
+@lru_cache(maxsize=None)
+def load_answer_key(pdf_path):
+    """Return the answer key of an answers PDF, parsed once per process."""
+    return build_answer_key(iter_pages(pdf_path))
+
+def main():
+    """Index the answer PDFs and report, or dump, what was found."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('pdfs', nargs='*', type=Path,
+                        default=[Path("Maths/Part 1/lemh1an.pdf"), Path("Physics/Part 1/leph1an.pdf")],
+                        help='answer PDFs to index')
+    parser.add_argument('-o', '--output', type=Path, help='write the index as JSON to this file')
+    args = parser.parse_args()
+
+    index = {}
+    for pdf_path in args.pdfs:
+        answers = load_answer_key(pdf_path)
+        chapters = sorted({chapter for chapter, _, _ in answers})
+        print(f"{pdf_path.name}: {len(answers)} answers in chapters {', '.join(map(str, chapters))}")
+        index[pdf_path.name] = [[chapter, exercise, number, answer]
+                                for (chapter, exercise, number), answer in sorted(answers.items())]
+    if args.output:
+        args.output.write_text(json.dumps(index, ensure_ascii=False, indent=1) + "\n", encoding='utf-8')
+        print(f"Wrote {args.output}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
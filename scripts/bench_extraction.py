@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+Benchmark PDF extraction per file against a saved baseline.
+
+For every PDF in Maths/Part 1 and Physics/Part 1, the text of each page is
+parsed with PyMuPDF (bypassing the page cache) and then run through the
+subject's extract_questions_and_solutions(). Each PDF is measured in a fresh
+worker process, so its peak RSS is its own. The report gives pages/s and MB/s,
+the parse and regex time, and the peak RSS. --save stores the results as the
+baseline; later runs exit non-zero when a PDF got slower, or used more memory,
+than the baseline by more than the threshold.
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from pdf_text import file_hash, iter_pdf_pages
+import extract_math_detailed
+import extract_physics_detailed
+
+try:
+    import resource
+except ImportError:  # not available on Windows; peak RSS is then not reported
+    resource = None
+
+BASELINE_PATH = Path(os.environ.get("BENCH_BASELINE", ".cache/bench/extraction.json"))
+
+# Timing differences below this are noise on the small PDFs, whatever the ratio.
+MIN_DELTA_SECONDS = 0.005
+
+# Compared against the baseline; a larger value is a regression for all of them.
+METRICS = ['parse_seconds', 'regex_seconds', 'peak_rss']
+
+def extractor_for(pdf_path):
+    """Return the extract_questions_and_solutions of the subject a PDF belongs to."""
+    module = extract_math_detailed if pdf_path.name.startswith('lemh') else extract_physics_detailed
+    return module.extract_questions_and_solutions
+
+def peak_rss():
+    """Return this process's peak resident set size in bytes, or None where it cannot be read."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == 'darwin' else peak * 1024  # ru_maxrss is in KB on Linux
+
+def measure_pdf(task):
+    """Time parsing and question extraction of one PDF, keeping the best of repeat runs."""
+    pdf_path, repeat, layout = task
+    extract = extractor_for(pdf_path)
+    parse_seconds = regex_seconds = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        pages = list(iter_pdf_pages(pdf_path, layout))
+        parse_seconds = min(parse_seconds, time.perf_counter() - start)
+
+        start = time.perf_counter()
+        questions = sum(1 for _ in extract(iter(pages), pdf_path.name))
+        regex_seconds = min(regex_seconds, time.perf_counter() - start)
+
+    return {
+        'sha256': file_hash(pdf_path),
+        'bytes': pdf_path.stat().st_size,
+        'pages': len(pages),
+        'questions': questions,
+        'parse_seconds': parse_seconds,
+        'regex_seconds': regex_seconds,
+        'peak_rss': peak_rss(),
+    }
+
+def measure_all(pdf_files, repeat, layout=False):
+    """Yield (pdf_path, result) for each PDF, measured one at a time, each in a new process."""
+    # One worker and one task per child: no two PDFs share a process or compete for a CPU.
+    with ProcessPoolExecutor(max_workers=1, max_tasks_per_child=1) as pool:
+        for pdf_path in pdf_files:
+            yield pdf_path, pool.submit(measure_pdf, (pdf_path, repeat, layout)).result()
+
+def regressions(result, baseline, threshold):
+    """Return the metrics of result that exceed the baseline by more than threshold."""
+    if baseline is None or baseline['sha256'] != result['sha256']:
+        return []
+    worse = []
+    for metric in METRICS:
+        old, new = baseline.get(metric), result[metric]
+        if old is None or new is None:
+            continue
+        if metric.endswith('_seconds') and new - old < MIN_DELTA_SECONDS:
+            continue
+        if new > old * (1 + threshold):
+            worse.append(f"{metric} {old:.4g} -> {new:.4g}")
+    return worse
+
+def load_baseline(path):
+    """Return the saved results keyed by PDF name, or an empty dict."""
+    if not path.exists():
+        return {}
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)['results']
+
+def save_baseline(path, results):
+    """Write results as the new baseline."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump({'python': sys.version.split()[0], 'results': results}, f, indent=2, sort_keys=True)
+    os.replace(tmp_path, path)
+
+def parse_args():
+    """Parse command-line options."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('dirs', nargs='*', type=Path,
+                        default=[Path("Maths/Part 1"), Path("Physics/Part 1")],
+                        help='directories containing the PDFs to benchmark')
+    parser.add_argument('-r', '--repeat', type=int, default=3, help='runs per PDF (best is kept)')
+    parser.add_argument('-t', '--threshold', type=float, default=0.25,
+                        help='allowed slowdown or memory growth over the baseline (default: 0.25 = 25%%)')
+    parser.add_argument('-b', '--baseline', type=Path, default=BASELINE_PATH,
+                        help=f'baseline file (default: {BASELINE_PATH})')
+    parser.add_argument('--layout', action='store_true', help='benchmark layout-order extraction')
+    parser.add_argument('--save', action='store_true', help='store this run as the baseline')
+    args = parser.parse_args()
+    if args.layout and args.baseline == BASELINE_PATH:
+        args.baseline = BASELINE_PATH.with_name("extraction-layout.json")  # its own baseline
+    return args
+
+def main():
+    """Benchmark every PDF, compare with the baseline and report."""
+    args = parse_args()
+    pdf_files = sorted(pdf for directory in args.dirs for pdf in directory.glob("*.pdf"))
+    if not pdf_files:
+        print("No PDF files found")
+        return 1
+    baseline = load_baseline(args.baseline)
+
+    print(f"{'PDF':<14}{'pages':>6}{'MB':>7}{'parse':>10}{'regex':>10}{'pages/s':>9}{'MB/s':>7}"
+          f"{'peak RSS':>10}{'Qs':>5}  vs baseline")
+    results = {}
+    failed = []
+    for pdf_path, result in measure_all(pdf_files, args.repeat, args.layout):
+        results[pdf_path.name] = result
+        total = result['parse_seconds'] + result['regex_seconds']
+        megabytes = result['bytes'] / 1e6
+        rss = f"{result['peak_rss'] / 1e6:>8.0f}MB" if result['peak_rss'] is not None else f"{'-':>10}"
+        old = baseline.get(pdf_path.name)
+        worse = regressions(result, old, args.threshold)
+        if old is None or old['sha256'] != result['sha256']:
+            verdict = "no baseline"
+        elif worse:
+            verdict = "SLOWER: " + ", ".join(worse)
+            failed.append(pdf_path.name)
+        else:
+            verdict = f"{total / (old['parse_seconds'] + old['regex_seconds']):.2f}x time"
+        print(f"{pdf_path.name:<14}{result['pages']:>6}{megabytes:>7.1f}"
+              f"{result['parse_seconds'] * 1000:>8.0f}ms{result['regex_seconds'] * 1000:>8.1f}ms"
+              f"{result['pages'] / total:>9.0f}{megabytes / total:>7.1f}{rss}{result['questions']:>5}  {verdict}")
+
+    pages = sum(result['pages'] for result in results.values())
+    parse = sum(result['parse_seconds'] for result in results.values())
+    regex = sum(result['regex_seconds'] for result in results.values())
+    megabytes = sum(result['bytes'] for result in results.values()) / 1e6
+    print(f"Total: {pages} pages, {megabytes:.1f}MB in {parse + regex:.2f}s "
+          f"({pages / (parse + regex):.0f} pages/s, {megabytes / (parse + regex):.1f}MB/s); "
+          f"regex is {regex / (parse + regex):.1%} of the time")
+
+    if args.save:
+        save_baseline(args.baseline, results)
+        print(f"Saved baseline to {args.baseline}")
+    if failed:
+        print(f"Regressed beyond {args.threshold:.0%} on: {', '.join(failed)}")
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Benchmark the compiled problem page template against the per-generator f-strings it replaced.
+
+Renders the problems in the store, repeated up to the requested page count,
+through both and reports pages per second.
+"""
+
+import argparse
+import itertools
+import time
+from page_template import PROBLEM_PAGE, compile_template, render_problem_page
+from problem_store import iter_problems
+from site_assets import PROBLEM_STYLESHEET
+
+def legacy_problem_html(chapter, problem_num, title, question, background, solution, tips, formulas, visualization_svg):
+    """The create_problem_html f-string the generators each carried a copy of."""
+    return f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+  <meta charset="utf-8" />
+  <meta name="viewport" content="width=device-width, initial-scale=1" />
+  <title>Ch {chapter} Problem {problem_num} — {title}</title>
+  {PROBLEM_STYLESHEET}
+</head>
+<body>
+  <div class="container">
+    <h1>Chapter {chapter} · Problem {problem_num}</h1>
+    <div class="panel q">
+      <h2>Question</h2>
+      <p>{question}</p>
+    </div>
+
+    <div class="concept-section">
+      <h2>Background Concept — {title}</h2>
+      {background}
+    </div>
+
+    <div class="panel">
+      <h2>Visualization</h2>
+      {visualization_svg}
+    </div>
+
+    <div class="panel solution">
+      <h2>Solution</h2>
+      <p>{solution}</p>
+    </div>
+
+    <div class="panel">
+      <h2>Tips to Solve</h2>
+      <ul>
+        {tips}
+      </ul>
+    </div>
+
+    <div class="panel">
+      <h2>Key Formulas</h2>
+      <div class="formula">
+        {formulas}
+      </div>
+    </div>
+
+    <div class="panel">
+      <h2>Source</h2>
+      <p class="muted">Expected 12th Board 2026 - Chapter {chapter}</p>
+    </div>
+  </div>
+</body>
+</html>"""
+
+def best_rate(render, arguments, repeat):
+    """Return the best pages per second over repeat runs."""
+    best = 0.0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for args in arguments:
+            render(*args)
+        elapsed = time.perf_counter() - start
+        best = max(best, len(arguments) / elapsed)
+    return best
+
+def main():
+    """Render the store through both templates and report pages per second."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('-p', '--pages', type=int, default=5000, help='pages rendered per run')
+    parser.add_argument('-r', '--repeat', type=int, default=5, help='runs per measurement (best is kept)')
+    args = parser.parse_args()
+
+    problems = [problem for problem in iter_problems() if problem.get('svg')]
+    arguments = [
+        (problem['chapter'], problem['num'], problem['title'], problem['question'], problem['background'],
+         problem['solution'], "\n".join(problem['tips']), problem['formulas'], problem['svg'])
+        for problem in itertools.islice(itertools.cycle(problems), args.pages)
+    ]
+
+    for page_args in arguments[:len(problems)]:
+        if legacy_problem_html(*page_args) != render_problem_page(*page_args):
+            print(f"Output differs for Ch {page_args[0]} Problem {page_args[1]}")
+            return 1
+
+    start = time.perf_counter()
+    compile_template(PROBLEM_PAGE + " ")  # a fresh template, so this measures a cold compile
+    compile_time = time.perf_counter() - start
+
+    legacy = best_rate(legacy_problem_html, arguments, args.repeat)
+    compiled = best_rate(render_problem_page, arguments, args.repeat)
+    print(f"Template compiled once in {compile_time * 1000:.2f}ms")
+    print(f"{'f-string':<12}{legacy:>12,.0f} pages/s")
+    print(f"{'compiled':<12}{compiled:>12,.0f} pages/s ({compiled / legacy:.2f}x)")
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Benchmark the single-pass question scanner against the per-pattern regex loops it replaced.
+
+Runs both over the text of every PDF in Maths/Part 1 and Physics/Part 1 and
+exits non-zero if the scanner is slower on any of them.
+"""
+
+import argparse
+import re
+import sys
+import time
+from pathlib import Path
+from pdf_text import read_page_texts
+from question_scanner import scan
+
+# The per-pattern loops previously used by extract_questions_and_solutions ...
+LEGACY_DETAILED_PATTERNS = [
+    r'(?:^|\n)\s*(\d+[\.\)]\s+[^?\n]+\?)\s*(.*?)(?=\n\s*\d+[\.\)]|\n\s*$|\Z)',
+    r'(?:^|\n)\s*Problem\s+(\d+\.\d+)[:\s]+([^?\n]+\?)\s*(.*?)(?=\n\s*Problem|\n\s*$|\Z)',
+    r'(?:^|\n)\s*Example\s+(\d+)[:\s]+([^?\n]+\?)\s*(.*?)(?=\n\s*Example|\n\s*$|\Z)',
+    r'(?:^|\n)\s*Q(\d+)[\.\)]\s+([^?\n]+\?)\s*(.*?)(?=\n\s*Q\d+|\n\s*$|\Z)',
+    r'(?:^|\n)\s*(\d+[\.\)]\s+[^?\n]+(?:calculate|find|determine|show|prove|derive)[^?\n]*\?)\s*(.*?)(?=\n\s*\d+[\.\)]|\n\s*$|\Z)',
+]
+
+# ... and by extract_questions_from_text.
+LEGACY_QUESTION_PATTERNS = [
+    r'(?:^|\n)\s*(?:Exercise\s+)?(\d+[\.\)]\s+[^?\n]+\?)',
+    r'(?:^|\n)\s*Q(\d+)[\.\)]\s+([^?\n]+\?)',
+    r'(?:^|\n)\s*(\d+[\.\)]\s+[^?\n]+\?)',
+    r'(?:^|\n)\s*Problem\s+(\d+\.\d+)[:\s]+([^?\n]+\?)',
+    r'(?:^|\n)\s*Example\s+(\d+)[:\s]+([^?\n]+\?)',
+    r'(?:^|\n)\s*([A-Z][^?\n]+\?)',
+]
+
+def legacy_detailed(text):
+    """Run the old detailed-extraction loop, returning the number of matches."""
+    count = 0
+    for pattern in LEGACY_DETAILED_PATTERNS:
+        count += sum(1 for _ in re.finditer(pattern, text, re.MULTILINE | re.IGNORECASE | re.DOTALL))
+    return count
+
+def legacy_questions(text):
+    """Run the old question-index loop, returning the number of matches."""
+    count = 0
+    for pattern in LEGACY_QUESTION_PATTERNS:
+        count += sum(1 for _ in re.finditer(pattern, text, re.MULTILINE | re.IGNORECASE))
+    return count
+
+def scanner_detailed(text):
+    """Run the single-pass scanner, returning the number of matches."""
+    return sum(1 for _ in scan(text))
+
+def scanner_questions(text):
+    """Run the single-pass scanner with bare questions, returning the number of matches."""
+    return sum(1 for _ in scan(text, include_direct=True))
+
+def best_time(func, text, repeat):
+    """Return (best wall-clock seconds over repeat runs, match count)."""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        count = func(text)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, count
+
+def main():
+    """Benchmark every PDF and report per-file timings."""
+    parser = argparse.ArgumentParser(description=__doc__.strip())
+    parser.add_argument('dirs', nargs='*', type=Path,
+                        default=[Path("Maths/Part 1"), Path("Physics/Part 1")],
+                        help='directories containing the PDFs to benchmark')
+    parser.add_argument('-r', '--repeat', type=int, default=5, help='runs per measurement (best is kept)')
+    args = parser.parse_args()
+
+    pdf_files = sorted(pdf for directory in args.dirs for pdf in directory.glob("*.pdf"))
+    if not pdf_files:
+        print("No PDF files found")
+        return 1
+
+    print(f"{'PDF':<14}{'KB text':>9}{'legacy':>11}{'scanner':>11}{'speedup':>9}"
+          f"{'legacy Q':>11}{'scanner Q':>11}{'speedup':>9}  matches")
+    slower = []
+    for pdf_path in pdf_files:
+        text = "".join(page + "\n" for page in read_page_texts(pdf_path))
+        old_time, old_count = best_time(legacy_detailed, text, args.repeat)
+        new_time, new_count = best_time(scanner_detailed, text, args.repeat)
+        old_q_time, old_q_count = best_time(legacy_questions, text, args.repeat)
+        new_q_time, new_q_count = best_time(scanner_questions, text, args.repeat)
+
+        speedup = old_time / new_time if new_time else float('inf')
+        q_speedup = old_q_time / new_q_time if new_q_time else float('inf')
+        print(f"{pdf_path.name:<14}{len(text) / 1024:>9.0f}"
+              f"{old_time * 1000:>9.1f}ms{new_time * 1000:>9.1f}ms{speedup:>8.1f}x"
+              f"{old_q_time * 1000:>9.1f}ms{new_q_time * 1000:>9.1f}ms{q_speedup:>8.1f}x"
+              f"  {old_count}->{new_count}, {old_q_count}->{new_q_count}")
+        if new_time > old_time or new_q_time > old_q_time:
+            slower.append(pdf_path.name)
+
+    if slower:
+        print(f"Scanner was slower on: {', '.join(slower)}")
+        return 1
+    print(f"Scanner was faster on all {len(pdf_files)} PDFs")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
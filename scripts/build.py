@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""
+Build every generated problem page from the problem store, make-style.
+
+Each record in data/problems is one target: its page under Physics/, Maths/ or
+chemistry/ is rendered by the generator script named in the record. A target's
+inputs are the record itself and the sources of its generator and of the shared
+site assets; their hash is kept in .cache/build-state.json, and a page is only
+rebuilt when that hash changes, when the page is missing, or when it no longer
+matches what was built.
+"""
+
+import argparse
+import hashlib
+import importlib
+import json
+import os
+import sys
+import time
+from pathlib import Path
+from check_links import run_check
+from compress_site import compress_site, print_savings
+from instrument import enable, finish_trace, span
+from page_writer import page_bytes, print_write_summary, render_pages, write_pages
+from problem_store import HAND_EDITED_GENERATORS, iter_problems
+from search_index import write_search_index
+from site_assets import write_stylesheet
+from site_index import write_site_indexes
+from svg_sprites import write_store_sprite_sheet
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+STATE_PATH = Path(os.environ.get("BUILD_STATE", ".cache/build-state.json"))
+
+# Site directory for each subject; the chemistry pages live in lowercase chemistry/.
+SUBJECT_DIRS = {
+    'physics': Path("Physics"),
+    'maths': Path("Maths"),
+    'chemistry': Path("chemistry"),
+}
+
+# Modules every page's rendering depends on besides its own generator.
+SHARED_SOURCES = ["page_template.py", "site_assets.py", "svg_sprites.py"]
+
+def content_hash(data):
+    """Return the SHA-256 hex digest of bytes."""
+    return hashlib.sha256(data).hexdigest()
+
+def target_path(record):
+    """Return the page a problem record renders to."""
+    chapter, num = record['chapter'], record['num']
+    return SUBJECT_DIRS[record['subject']] / f"ch{chapter}" / f"problem-{chapter}-{num:02d}.html"
+
+def generator_source(generator):
+    """Return the path of a generator script."""
+    return SCRIPTS_DIR / f"{generator}.py"
+
+def dependency_graph(subjects=None, include_hand_edited=False):
+    """Map each target page to the record and generator that produce it.
+
+    Raises ValueError if two records would write the same page.
+    """
+    shared_hash = content_hash(b"".join((SCRIPTS_DIR / name).read_bytes() for name in SHARED_SOURCES))
+    generator_hashes = {}
+    graph = {}
+    for record in iter_problems():
+        if subjects and record['subject'] not in subjects:
+            continue
+        generator = record['generator']
+        if generator in HAND_EDITED_GENERATORS and not include_hand_edited:
+            continue
+        if generator not in generator_hashes:
+            generator_hashes[generator] = content_hash(generator_source(generator).read_bytes()
+                                                       + shared_hash.encode('ascii'))
+
+        target = target_path(record)
+        if target in graph:
+            raise ValueError(f"{target} is produced by both {graph[target]['record']['id']} and {record['id']}")
+        record_json = json.dumps(record, sort_keys=True, ensure_ascii=False).encode('utf-8')
+        graph[target] = {
+            'record': record,
+            'generator': generator,
+            'inputs': content_hash(record_json + generator_hashes[generator].encode('ascii')),
+        }
+    return graph
+
+def load_state():
+    """Load the inputs and output hashes recorded by the previous build."""
+    if not STATE_PATH.exists():
+        return {}
+    try:
+        with open(STATE_PATH, encoding='utf-8') as f:
+            return json.load(f)
+    except ValueError as e:
+        print(f"Ignoring unreadable build state {STATE_PATH}: {e}")
+        return {}
+
+def save_state(state):
+    """Write the build state atomically."""
+    STATE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = STATE_PATH.with_name(f"{STATE_PATH.name}.{os.getpid()}.tmp")
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(state, f, indent=1, sort_keys=True)
+    os.replace(tmp_path, STATE_PATH)
+
+def stale_reason(target, node, state):
+    """Return why a target needs rebuilding, or None if it is up to date."""
+    previous = state.get(str(target))
+    if not target.exists():
+        return "missing"
+    if previous is None:
+        return "new"
+    if previous['inputs'] != node['inputs']:
+        return "inputs changed"
+    if previous['output'] != content_hash(target.read_bytes()):
+        return "output modified"
+    return None
+
+def render_target(node):
+    """Render a target page in a worker; return (html, seconds spent rendering)."""
+    start = time.perf_counter()
+    with span("render target", generator=node['generator']):
+        html_content = importlib.import_module(node['generator']).render_problem(node['record'])
+    return html_content, time.perf_counter() - start
+
+def parse_args():
+    """Parse command-line options."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('subjects', nargs='*', metavar='subject',
+                        help='only build these subjects (physics, maths, chemistry)')
+    parser.add_argument('-f', '--force', action='store_true', help='rebuild every target')
+    parser.add_argument('-n', '--dry-run', action='store_true', help='list stale targets without building')
+    parser.add_argument('-j', '--jobs', type=int, default=1,
+                        help='render with this many worker processes (0 = one per CPU, default: 1)')
+    parser.add_argument('-z', '--compress', action='store_true',
+                        help='afterwards write .gz (and .br) siblings of every site file')
+    parser.add_argument('--trace', metavar='FILE',
+                        help='write a Chrome trace of the build to FILE and print a timing summary')
+    parser.add_argument('--no-check', action='store_true', help='skip the link check that gates the build')
+    parser.add_argument('--strict', action='store_true',
+                        help='also fail the link check on orphaned pages (by default they are only reported)')
+    parser.add_argument('--all', action='store_true',
+                        help=f"also build pages of hand-edited generators ({', '.join(sorted(HAND_EDITED_GENERATORS))})")
+    args = parser.parse_args()
+    unknown = set(args.subjects) - set(SUBJECT_DIRS)
+    if unknown:
+        parser.error(f"unknown subject: {', '.join(sorted(unknown))}")
+    return args
+
+def main():
+    """Rebuild stale targets and print a per-target timing summary."""
+    args = parse_args()
+    if args.trace:
+        enable(args.trace)
+    graph = dependency_graph(args.subjects, args.all)
+    state = load_state()
+    if not args.dry_run:
+        print(f"Stylesheet: {write_stylesheet()}")
+        sheet, symbols = write_store_sprite_sheet()
+        print(f"Sprite sheet: {sheet} ({symbols} symbols)")
+
+    start = time.perf_counter()
+    stale = []
+    for target, node in sorted(graph.items()):
+        reason = "forced" if args.force else stale_reason(target, node, state)
+        if reason is not None:
+            stale.append((target, node, reason))
+
+    if args.dry_run:
+        for target, node, reason in stale:
+            print(f"{str(target):<40}{node['generator']:<36}{reason}")
+        print(f"{len(stale)} of {len(graph)} targets would be rebuilt")
+        return 0
+
+    # Pages are rendered on a process pool and written on a thread pool as they
+    # arrive; both hand results back in target order, so the log is the same on
+    # every run.
+    rendered = render_pages(render_target, [node for _, node, _ in stale], args.jobs)
+    outputs = []  # (output hash, render seconds), filled as pages reach the writers
+
+    def pages():
+        for (target, _, _), (html_content, elapsed) in zip(stale, rendered):
+            outputs.append((content_hash(page_bytes(html_content)), elapsed))
+            yield target, html_content
+
+    built = []
+    for index, (target, written) in enumerate(write_pages(pages())):
+        _, node, reason = stale[index]
+        output, elapsed = outputs[index]
+        state[str(target)] = {'inputs': node['inputs'], 'output': output}
+        built.append((target, node, reason, elapsed))
+        print(f"{str(target):<40}{node['generator']:<36}{reason:<16}{elapsed * 1000:>8.1f}ms"
+              f"{'' if written else '  (unchanged)'}")
+
+    save_state(state)
+    with span("search index"):
+        doc_count, term_count, shard_count = write_search_index()
+    print(f"Search index: {doc_count} problems, {term_count} terms in {shard_count} shards")
+    with span("site index"):
+        indexes = write_site_indexes(args.subjects)
+    for subject, (pages, rendered) in indexes.items():
+        print(f"{subject.capitalize()} index: {pages} problems, {rendered} chapters rendered")
+    total = time.perf_counter() - start
+
+    by_generator = {}
+    for _, node, _, elapsed in built:
+        count, seconds = by_generator.get(node['generator'], (0, 0.0))
+        by_generator[node['generator']] = (count + 1, seconds + elapsed)
+    for generator, (count, seconds) in sorted(by_generator.items(), key=lambda item: -item[1][1]):
+        print(f"  {generator:<36}{count:>4} pages{seconds * 1000:>10.1f}ms")
+    print(f"Built {len(built)} of {len(graph)} targets in {total:.2f}s "
+          f"({len(graph) - len(built)} up to date)")
+    print_write_summary()
+
+    # A broken link fails the build before anything is compressed or deployed;
+    # orphaned pages are listed as warnings and only fail it with --strict.
+    with span("link check"):
+        status = 0 if args.no_check else run_check(jobs=args.jobs, strict=args.strict)
+    if status == 0 and args.compress:
+        with span("compress"):
+            print_savings(compress_site(Path("."), jobs=args.jobs))
+    finish_trace()
+    return status
+
+if __name__ == "__main__":
+    sys.exit(main())
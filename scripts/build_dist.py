@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Assemble the deploy artifact: only the files the site actually links to.
+
+Starting from index.html, every page is scanned for href/src attributes and
+CSS url() references, and every local target is followed in turn. The search
+page loads its index from JavaScript, so its meta.json, docs.json and shards
+are followed explicitly. Whatever is reached is copied into dist/, together
+with a manifest.json listing each file's size, so the Pages upload leaves out
+the source PDFs, scripts/ and stray files in the repository root.
+"""
+
+import argparse
+import json
+import os
+import re
+import shutil
+import sys
+from collections import deque
+from pathlib import Path
+from urllib.parse import unquote, urlsplit
+from compress_site import compress_site, print_savings
+from page_writer import write_page
+
+DIST_DIR = Path("dist")
+MANIFEST_NAME = "manifest.json"
+
+# Files that can reference others; anything else (PDFs, images) is a leaf.
+SCANNED_SUFFIXES = {'.html', '.css', '.svg'}
+
+LINK_RE = re.compile(r'''\b(?:href|src)\s*=\s*(?:"([^"]*)"|'([^']*)')''', re.IGNORECASE)
+CSS_URL_RE = re.compile(r'''url\(\s*['"]?([^'")]+?)['"]?\s*\)''')
+FETCH_RE = re.compile(r'''fetch(?:JSON)?\(\s*'([^'$`]+)'\s*\)''')
+
+def link_targets(markup):
+    """Return every URL a page references through href, src, url() or a literal fetch()."""
+    urls = [double or single for double, single in LINK_RE.findall(markup)]
+    urls.extend(CSS_URL_RE.findall(markup))
+    urls.extend(FETCH_RE.findall(markup))
+    return urls
+
+def resolve_link(root, page, url):
+    """Map a URL found in page (a path relative to root) to the file it names, or None if not local."""
+    parts = urlsplit(url)
+    if parts.scheme or parts.netloc or not parts.path:
+        return None  # external, mailto:, data: or a same-page #fragment
+    path = unquote(parts.path)
+    target = Path(os.path.normpath(path.lstrip('/') if path.startswith('/') else page.parent / path))
+    if target.parts[:1] == ('..',):
+        return None  # outside the site
+    if path.endswith('/') or (root / target).is_dir():
+        target = target / "index.html"
+    return target
+
+def search_index_files(root, meta_path):
+    """Return the shards search/meta.json lists; search/index.html fetches them by name at runtime."""
+    meta = json.loads((root / meta_path).read_text(encoding='utf-8'))
+    return [meta_path.parent / "shards" / f"{name}.json" for name in meta.get('shards', [])]
+
+def crawl(root, start="index.html"):
+    """Return (reachable files, missing links) found by following local links from start."""
+    start = Path(start)
+    seen = {start}
+    queue = deque([start])
+    missing = []
+    while queue:
+        path = queue.popleft()
+        full = root / path
+        if not full.is_file():
+            continue
+        if path.suffix in SCANNED_SUFFIXES:
+            try:
+                markup = full.read_text(encoding='utf-8')
+            except UnicodeDecodeError:
+                markup = ""
+            targets = [resolve_link(root, path, url) for url in link_targets(markup)]
+        elif path.name == "meta.json":
+            targets = search_index_files(root, path)
+        else:
+            targets = []
+        for target in targets:
+            if target is None or target in seen:
+                continue
+            seen.add(target)
+            if (root / target).is_file():
+                queue.append(target)
+            else:
+                missing.append((path, target))
+    return sorted(path for path in seen if (root / path).is_file()), missing
+
+def copy_files(root, files, out_dir):
+    """Copy files (paths relative to root) into a fresh out_dir."""
+    if out_dir.exists():
+        shutil.rmtree(out_dir)
+    for path in files:
+        (out_dir / path).parent.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(root / path, out_dir / path)
+
+def write_manifest(out_dir):
+    """Write manifest.json with the size of every file in out_dir; return (file count, total bytes)."""
+    manifest_path = out_dir / MANIFEST_NAME
+    sizes = {path.relative_to(out_dir).as_posix(): path.stat().st_size
+             for path in sorted(out_dir.rglob("*")) if path.is_file() and path != manifest_path}
+    manifest = {'files': len(sizes), 'bytes': sum(sizes.values()), 'sizes': sizes}
+    write_page(manifest_path, json.dumps(manifest, indent=2) + "\n")
+    return manifest['files'], manifest['bytes']
+
+def parse_args():
+    """Parse command-line options."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('root', nargs='?', type=Path, default=Path("."), help='site root (default: .)')
+    parser.add_argument('-o', '--output', type=Path, default=DIST_DIR, help='artifact directory (default: dist)')
+    parser.add_argument('-m', '--minify', action='store_true', help='minify the copied HTML, CSS and SVG')
+    parser.add_argument('-z', '--compress', action='store_true', help='write .gz (and .br) siblings in the artifact')
+    return parser.parse_args()
+
+def main():
+    """Build dist/ and report what went into it."""
+    args = parse_args()
+    if not (args.root / "index.html").is_file():
+        print(f"No index.html under {args.root}")
+        return 1
+    if args.output.exists() and any(args.output.iterdir()) and not (args.output / MANIFEST_NAME).exists():
+        print(f"{args.output} is not empty and holds no {MANIFEST_NAME}; refusing to replace it")
+        return 1
+
+    files, missing = crawl(args.root)
+    for page, target in missing:
+        print(f"Broken link: {page.as_posix()} -> {target.as_posix()}")
+    copy_files(args.root, files, args.output)
+
+    subjects = {}
+    for path in files:
+        subject = path.parts[0] if len(path.parts) > 1 else "(root)"
+        count, size = subjects.get(subject, (0, 0))
+        subjects[subject] = (count + 1, size + (args.root / path).stat().st_size)
+    for subject, (count, size) in sorted(subjects.items()):
+        print(f"{subject:<12}{count:>6} files {size / 1024:>10.1f}KB")
+
+    if args.minify or args.compress:
+        totals = compress_site(args.output, minify=args.minify, compress=args.compress)
+        print_savings(totals)
+    count, size = write_manifest(args.output)
+    print(f"Wrote {count} files ({size / 1024:.1f}KB) to {args.output}/, sizes in {args.output / MANIFEST_NAME}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Check the internal links of the generated site and find orphaned pages.
+
+Every HTML and SVG file in the tree is parsed in parallel with a streaming
+HTML parser that records the links and element ids it contains. Each local
+link is resolved to a file, and a #fragment to an id in it, so that broken
+links (a wrong page count in an index, Chemistry/ versus chemistry/, a
+missing sprite symbol) are reported with the page they appear on. Pages no
+link path from index.html reaches are reported as orphans. The exit status
+is non-zero when a link is broken, so the check can gate a build.
+"""
+
+import argparse
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from html.parser import HTMLParser
+from pathlib import Path
+from urllib.parse import unquote, urlsplit
+from build_dist import resolve_link
+
+PARSED_SUFFIXES = {'.html', '.svg'}
+LINK_ATTRS = {'href', 'src', 'xlink:href'}
+SKIPPED_DIRS = {'.git', '.cache', 'dist', 'scripts', 'data', 'node_modules', '__pycache__'}
+CHUNK_SIZE = 64 * 1024
+
+class LinkCollector(HTMLParser):
+    """Collect the link targets and element ids of a document as it is fed."""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.links = []
+        self.ids = set()
+
+    def handle_starttag(self, tag, attrs):
+        for name, value in attrs:
+            if value is None:
+                continue
+            if name in LINK_ATTRS:
+                self.links.append(value)
+            elif name == 'id':
+                self.ids.add(value)
+
+    handle_startendtag = handle_starttag
+
+def parse_file(path):
+    """Stream one file through the parser; return (links, ids)."""
+    collector = LinkCollector()
+    with open(path, encoding='utf-8', errors='replace') as f:
+        while chunk := f.read(CHUNK_SIZE):
+            collector.feed(chunk)
+    collector.close()
+    return collector.links, collector.ids
+
+def iter_site_files(root):
+    """Yield every HTML and SVG file under root, relative to it, skipping build and source directories."""
+    for directory, subdirs, files in os.walk(root):
+        subdirs[:] = sorted(d for d in subdirs if d not in SKIPPED_DIRS and not d.startswith('.'))
+        for name in sorted(files):
+            if Path(name).suffix in PARSED_SUFFIXES:
+                yield (Path(directory) / name).relative_to(root)
+
+def build_link_graph(root, files, jobs=0):
+    """Parse files in parallel; return {path: (links, ids)}."""
+    with ProcessPoolExecutor(max_workers=jobs or os.cpu_count()) as pool:
+        parsed = pool.map(parse_file, [root / path for path in files], chunksize=16)
+        return dict(zip(files, parsed))
+
+def case_hint(root, target):
+    """Return the real path of target when only its letter case is wrong, else None."""
+    current = root
+    for part in target.parts:
+        if not current.is_dir():
+            return None
+        matches = [entry for entry in current.iterdir() if entry.name.lower() == part.lower()]
+        if not matches:
+            return None
+        current = matches[0]
+    return current.relative_to(root)
+
+def check_links(root, graph, start="index.html"):
+    """Resolve every link in graph; return (broken, orphans).
+
+    broken is a list of (page, url, reason); orphans lists the HTML pages that
+    cannot be reached from start.
+    """
+    broken = []
+    edges = {}
+    for page, (links, _) in graph.items():
+        targets = edges[page] = set()
+        for url in links:
+            target = resolve_link(root, page, url)
+            if target is None:
+                continue
+            fragment = unquote(urlsplit(url).fragment)
+            if target in graph:
+                targets.add(target)
+                if fragment and fragment not in graph[target][1]:
+                    broken.append((page, url, f"no #{fragment} in {target.as_posix()}"))
+            elif not (root / target).is_file():
+                hint = case_hint(root, target)
+                reason = f"exists as {hint.as_posix()}" if hint else "missing"
+                broken.append((page, url, reason))
+
+    start = Path(start)
+    reached = {start}
+    queue = deque([start])
+    while queue:
+        for target in edges.get(queue.popleft(), ()):
+            if target not in reached:
+                reached.add(target)
+                queue.append(target)
+    orphans = [page for page in graph if page.suffix == '.html' and page not in reached]
+    return broken, orphans
+
+def parse_args():
+    """Parse command-line options."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('root', nargs='?', type=Path, default=Path("."), help='site root (default: .)')
+    parser.add_argument('-j', '--jobs', type=int, default=0,
+                        help='number of worker processes (default: one per CPU)')
+    parser.add_argument('--strict', action='store_true', help='also fail when there are orphaned pages')
+    return parser.parse_args()
+
+def run_check(root=Path("."), jobs=0, strict=False):
+    """Check the site under root and print the findings; return the exit status."""
+    started = time.perf_counter()
+    files = list(iter_site_files(root))
+    graph = build_link_graph(root, files, jobs)
+    broken, orphans = check_links(root, graph)
+
+    for page, url, reason in broken:
+        print(f"Broken link: {page.as_posix()} -> {url} ({reason})")
+    for page in orphans:
+        print(f"Orphaned page: {page.as_posix()}")
+    link_count = sum(len(links) for links, _ in graph.values())
+    print(f"Checked {link_count} links in {len(files)} files in {time.perf_counter() - started:.2f}s: "
+          f"{len(broken)} broken, {len(orphans)} orphaned")
+    return 1 if broken or (strict and orphans) else 0
+
+def main():
+    """Check the site's links."""
+    args = parse_args()
+    if not (args.root / "index.html").is_file():
+        print(f"No index.html under {args.root}")
+        return 1
+    return run_check(args.root, args.jobs, args.strict)
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+Post-build stage: minify the generated site and precompress it.
+
+Writes a .gz sibling, and a .br sibling when the brotli package is installed,
+next to every HTML, CSS, SVG and JSON file of the site, so a CDN or local
+mirror can serve the smallest encoding. With --minify the files themselves are
+minified first; run that on a deploy copy, not on the tree the generators own.
+Files are processed in parallel, and byte savings are reported per subject.
+"""
+
+import argparse
+import gzip
+import os
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from page_writer import write_bytes
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+SITE_DIRS = ["Physics", "Maths", "chemistry", "assets", "search"]
+SUFFIXES = {'.html', '.css', '.svg', '.json'}
+
+RAW_BLOCK_RE = re.compile(r'(<(script|pre|textarea|style)\b.*?</\2>)', re.DOTALL | re.IGNORECASE)
+STYLE_BLOCK_RE = re.compile(r'^(<style\b[^>]*>)(.*)(</style>)$', re.DOTALL | re.IGNORECASE)
+HTML_COMMENT_RE = re.compile(r'<!--(?!\[if).*?-->', re.DOTALL)
+CSS_COMMENT_RE = re.compile(r'/\*.*?\*/', re.DOTALL)
+CSS_PUNCTUATION_RE = re.compile(r'\s*([{};,])\s*')
+CSS_COLON_RE = re.compile(r':\s+')
+WHITESPACE_RE = re.compile(r'\s+')
+BETWEEN_TAGS_RE = re.compile(r'>\s+<')
+
+def minify_css(css):
+    """Drop comments and the whitespace CSS does not need."""
+    css = WHITESPACE_RE.sub(' ', CSS_COMMENT_RE.sub('', css))
+    css = CSS_COLON_RE.sub(':', CSS_PUNCTUATION_RE.sub(r'\1', css))
+    return css.replace(';}', '}').strip()
+
+def collapse_whitespace(markup):
+    """Collapse each whitespace run to one newline or space; browsers render both the same."""
+    return WHITESPACE_RE.sub(lambda m: '\n' if '\n' in m.group(0) else ' ', markup)
+
+def minify_html(markup):
+    """Collapse whitespace and drop comments, leaving script, pre and textarea blocks untouched."""
+    parts = []
+    for index, part in enumerate(RAW_BLOCK_RE.split(markup)):
+        # split() interleaves text, whole raw blocks and the captured tag names.
+        if index % 3 == 0:
+            parts.append(collapse_whitespace(HTML_COMMENT_RE.sub('', part)))
+        elif index % 3 == 1:
+            style = STYLE_BLOCK_RE.match(part)
+            parts.append(f"{style.group(1)}{minify_css(style.group(2))}{style.group(3)}" if style else part)
+    return "".join(parts).strip() + "\n"
+
+def minify_svg(markup):
+    """Drop comments and the whitespace between elements."""
+    return BETWEEN_TAGS_RE.sub('><', collapse_whitespace(HTML_COMMENT_RE.sub('', markup))).strip() + "\n"
+
+MINIFIERS = {'.html': minify_html, '.css': minify_css, '.svg': minify_svg}
+
+def iter_site_files(root):
+    """Yield the compressible files of the site under root, in sorted order."""
+    candidates = list(root.glob("*.html"))
+    for directory in SITE_DIRS:
+        candidates.extend((root / directory).rglob("*"))
+    for path in sorted(candidates):
+        if path.is_file() and path.suffix in SUFFIXES:
+            yield path
+
+def iter_orphan_siblings(root):
+    """Yield the .gz and .br files of the site whose source file no longer exists."""
+    candidates = list(root.glob("*.gz")) + list(root.glob("*.br"))
+    for directory in SITE_DIRS:
+        candidates.extend((root / directory).rglob("*.gz"))
+        candidates.extend((root / directory).rglob("*.br"))
+    for path in sorted(candidates):
+        source = path.with_suffix('')
+        if source.suffix in SUFFIXES and not source.exists():
+            yield path
+
+def write_sibling(path, suffix, compressed, size):
+    """Write a compressed sibling when it is smaller than size, else remove any stale one; return whether written."""
+    sibling = path.with_name(path.name + suffix)
+    if compressed is not None and len(compressed) < size:
+        write_bytes(sibling, compressed)
+        return True
+    sibling.unlink(missing_ok=True)
+    return False
+
+def process_file(task):
+    """Minify and/or precompress one file; return its byte counts."""
+    path, minify, compress = task
+    data = path.read_bytes()
+    original = len(data)
+    if minify and path.suffix in MINIFIERS:
+        try:
+            data = MINIFIERS[path.suffix](data.decode('utf-8')).encode('utf-8')
+            write_bytes(path, data)
+        except UnicodeDecodeError:
+            pass  # not UTF-8 (e.g. a stray UTF-16 test page); compress it as it is
+
+    sizes = {'original': original, 'minified': len(data), 'gzip': len(data), 'brotli': len(data)}
+    if not compress:
+        return sizes
+    # mtime=0 keeps the output byte-identical across runs, so unchanged files are skipped.
+    compressed = gzip.compress(data, compresslevel=9, mtime=0)
+    if write_sibling(path, ".gz", compressed, len(data)):
+        sizes['gzip'] = len(compressed)
+    # Without brotli an old .br would go stale, so it is removed like any sibling not rewritten.
+    compressed = brotli.compress(data, quality=11) if brotli is not None else None
+    if write_sibling(path, ".br", compressed, len(data)):
+        sizes['brotli'] = len(compressed)
+    return sizes
+
+def subject_of(root, path):
+    """Group files by their top-level site directory."""
+    parts = path.relative_to(root).parts
+    return parts[0] if len(parts) > 1 else "(root)"
+
+def parse_args():
+    """Parse command-line options."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('root', nargs='?', type=Path, default=Path("."), help='site root (default: .)')
+    parser.add_argument('-m', '--minify', action='store_true', help='minify HTML, CSS and SVG files in place first')
+    parser.add_argument('-j', '--jobs', type=int, default=0,
+                        help='number of worker processes (default: one per CPU)')
+    return parser.parse_args()
+
+def compress_site(root, minify=False, jobs=0, compress=True):
+    """Precompress and/or minify every site file under root; return byte totals per subject.
+
+    Compressing also removes the .gz and .br siblings of files that have been deleted.
+    """
+    files = list(iter_site_files(root))
+    if compress:
+        for orphan in iter_orphan_siblings(root):
+            orphan.unlink()
+            print(f"Removed {orphan} (its source is gone)")
+    totals = {}
+    with ProcessPoolExecutor(max_workers=jobs or os.cpu_count()) as pool:
+        tasks = [(path, minify, compress) for path in files]
+        for path, sizes in zip(files, pool.map(process_file, tasks, chunksize=16)):
+            total = totals.setdefault(subject_of(root, path), dict.fromkeys(sizes, 0) | {'files': 0})
+            total['files'] += 1
+            for key, value in sizes.items():
+                total[key] += value
+    return totals
+
+def print_savings(totals):
+    """Print the per-subject byte savings table."""
+    if not totals:
+        print("Nothing to compress")
+        return
+    grand = {key: sum(total[key] for total in totals.values()) for key in next(iter(totals.values()))}
+    print(f"{'subject':<12}{'files':>7}{'original':>12}{'minified':>12}{'gzip':>12}{'brotli':>12}{'saved':>8}")
+    for subject, total in sorted(totals.items()) + [("total", grand)]:
+        saved = 1 - min(total['gzip'], total['brotli']) / total['original'] if total['original'] else 0.0
+        columns = "".join(f"{total[key] / 1024:>10.1f}KB" for key in ('original', 'minified', 'gzip'))
+        columns += f"{total['brotli'] / 1024:>10.1f}KB" if brotli is not None else f"{'-':>12}"
+        print(f"{subject:<12}{total['files']:>7}{columns}{saved:>8.0%}")
+
+def main():
+    """Precompress the site and report savings per subject."""
+    args = parse_args()
+    if brotli is None:
+        print("brotli is not installed; writing .gz files only (pip install brotli for .br)")
+    totals = compress_site(args.root, args.minify, args.jobs)
+    if not totals:
+        print(f"No site files found under {args.root}")
+        return 1
+    print_savings(totals)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
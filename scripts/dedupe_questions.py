@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""
+Find near-duplicate questions across subjects and sources with MinHash + LSH.
+
+Questions are collected from the *_questions_extracted.txt files and from the
+problem store. Each question is reduced to a MinHash
+signature over word shingles, and signatures are bucketed by band
+(locality-sensitive hashing), so only questions sharing a bucket are ever
+compared. Clusters of near-duplicates are written to a JSON report.
+iter_unique() applies the same test to a stream, for the extractors.
+"""
+
+import argparse
+import hashlib
+import json
+import random
+import re
+from pathlib import Path
+from problem_store import iter_problems
+
+NUM_PERM = 128
+# 32 bands of 4 rows put the S-curve midpoint near 0.42: a pair at 0.7 Jaccard
+# shares a bucket 99.98% of the time; similarity() then drops false candidates.
+BANDS = 32
+ROWS = NUM_PERM // BANDS
+SHINGLE_SIZE = 2
+DEFAULT_THRESHOLD = 0.7
+
+MERSENNE_PRIME = (1 << 61) - 1
+_rng = random.Random(20260101)  # fixed seed: signatures are comparable across runs
+PERMUTATIONS = [(_rng.randrange(1, MERSENNE_PRIME), _rng.randrange(0, MERSENNE_PRIME)) for _ in range(NUM_PERM)]
+
+EXTRACTED_FILES = {
+    'maths': Path("maths_questions_extracted.txt"),
+    'chemistry': Path("chemistry_questions_extracted.txt"),
+}
+
+HEADER_RE = re.compile(r'^(?:Question \d+.*|Problem \d+\.\d+):$')
+NUMBERED_LINE_RE = re.compile(r'^(\d+\.\d+): (.+)$')
+TAG_RE = re.compile(r'<[^>]+>')
+WORD_RE = re.compile(r'\w+')
+
+def iter_extracted_questions(subject, path):
+    """Yield question records from an extracted questions text file."""
+    if not path.exists():
+        print(f"Skipping missing {path}")
+        return
+
+    source = path.name
+    label = None
+    lines = []
+    for line in path.read_text(encoding='utf-8').splitlines() + [""]:
+        line = line.strip()
+        if line.startswith("SOURCE: "):
+            source = line[len("SOURCE: "):]
+        numbered = NUMBERED_LINE_RE.match(line)
+        if HEADER_RE.match(line):
+            label, lines = line.rstrip(':'), []
+        elif numbered and label is None:
+            yield {'id': f"{source}#{numbered.group(1)}", 'subject': subject, 'source': source,
+                   'text': numbered.group(2)}
+        elif line and label is not None:
+            lines.append(line)
+        elif not line and label is not None:
+            if lines:
+                yield {'id': f"{source}#{label}", 'subject': subject, 'source': source,
+                       'text': " ".join(lines)}
+            label, lines = None, []
+
+def iter_store_questions():
+    """Yield question records from the problem store."""
+    for problem in iter_problems():
+        yield {'id': problem['id'], 'subject': problem['subject'], 'source': problem['generator'],
+               'text': problem['question']}
+
+def collect_questions():
+    """Collect question records from every known source."""
+    questions = []
+    for subject, path in EXTRACTED_FILES.items():
+        questions.extend(iter_extracted_questions(subject, path))
+    questions.extend(iter_store_questions())
+    return questions
+
+def shingles(text):
+    """Return the set of hashed word shingles of a question."""
+    words = WORD_RE.findall(TAG_RE.sub(' ', text).lower())
+    if len(words) < SHINGLE_SIZE:
+        grams = [" ".join(words)]
+    else:
+        grams = [" ".join(words[i:i + SHINGLE_SIZE]) for i in range(len(words) - SHINGLE_SIZE + 1)]
+    return {int.from_bytes(hashlib.blake2b(gram.encode('utf-8'), digest_size=8).digest(), 'little')
+            for gram in grams}
+
+def minhash(shingle_set):
+    """Compute the MinHash signature of a set of hashed shingles."""
+    return tuple(min((a * x + b) % MERSENNE_PRIME for x in shingle_set) for a, b in PERMUTATIONS)
+
+def similarity(sig_a, sig_b):
+    """Estimate Jaccard similarity from two signatures."""
+    return sum(1 for a, b in zip(sig_a, sig_b) if a == b) / NUM_PERM
+
+def candidate_pairs(signatures):
+    """Yield index pairs that share at least one LSH band bucket."""
+    seen = set()
+    for band in range(BANDS):
+        buckets = {}
+        for index, signature in enumerate(signatures):
+            key = signature[band * ROWS:(band + 1) * ROWS]
+            buckets.setdefault(key, []).append(index)
+        for members in buckets.values():
+            for i in range(len(members)):
+                for j in range(i + 1, len(members)):
+                    pair = (members[i], members[j])
+                    if pair not in seen:
+                        seen.add(pair)
+                        yield pair
+
+def find_clusters(questions, threshold):
+    """Group questions into clusters of near-duplicates."""
+    signatures = [minhash(shingles(q['text'])) for q in questions]
+
+    parent = list(range(len(questions)))
+
+    def find(i):
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    pair_scores = {}
+    for i, j in candidate_pairs(signatures):
+        score = similarity(signatures[i], signatures[j])
+        if score >= threshold:
+            pair_scores[(i, j)] = score
+            parent[find(i)] = find(j)
+
+    groups = {}
+    for i in range(len(questions)):
+        groups.setdefault(find(i), []).append(i)
+    group_scores = {}
+    for (i, j), score in pair_scores.items():
+        group_scores.setdefault(find(i), []).append(score)
+
+    clusters = []
+    for root, members in groups.items():
+        if len(members) < 2:
+            continue
+        clusters.append({
+            'size': len(members),
+            'min_similarity': round(min(group_scores[root]), 3),
+            'subjects': sorted({questions[i]['subject'] for i in members}),
+            'members': [questions[i] for i in members],
+        })
+    clusters.sort(key=lambda c: (-c['size'], c['members'][0]['id']))
+    return clusters
+
+def iter_unique(items, text, threshold=DEFAULT_THRESHOLD):
+    """Yield the items whose text(item) is not a near-duplicate of an item already yielded.
+
+    Only the signatures of the kept items are held, bucketed by LSH band, never
+    the items themselves, so the stream can be of any length.
+    """
+    signatures = []
+    buckets = [{} for _ in range(BANDS)]
+    for item in items:
+        signature = minhash(shingles(text(item)))
+        keys = [signature[band * ROWS:(band + 1) * ROWS] for band in range(BANDS)]
+        candidates = {index for band, key in enumerate(keys) for index in buckets[band].get(key, ())}
+        if any(similarity(signature, signatures[index]) >= threshold for index in candidates):
+            continue
+        for band, key in enumerate(keys):
+            buckets[band].setdefault(key, []).append(len(signatures))
+        signatures.append(signature)
+        yield item
+
+def main():
+    """Find near-duplicate clusters and write the report."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('-t', '--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help=f'minimum estimated Jaccard similarity for a duplicate (default: {DEFAULT_THRESHOLD})')
+    parser.add_argument('-o', '--output', type=Path, default=Path("question_clusters.json"),
+                        help='where to write the cluster report')
+    args = parser.parse_args()
+
+    questions = collect_questions()
+    print(f"Collected {len(questions)} questions")
+
+    clusters = find_clusters(questions, args.threshold)
+    duplicates = sum(c['size'] - 1 for c in clusters)
+
+    report = {
+        'threshold': args.threshold,
+        'questions': len(questions),
+        'unique_questions': len(questions) - duplicates,
+        'clusters': clusters,
+    }
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+
+    for cluster in clusters:
+        ids = ", ".join(member['id'] for member in cluster['members'])
+        print(f"[{cluster['size']} × ≥{cluster['min_similarity']:.2f}] {cluster['members'][0]['text'][:60]}... ({ids})")
+    print(f"Found {len(clusters)} clusters covering {duplicates} duplicate questions; "
+          f"{report['unique_questions']} unique questions remain")
+    print(f"Report saved to: {args.output}")
+
+if __name__ == "__main__":
+    main()
@@ -3,61 +3,52 @@
 Extract questions and solutions from Maths PDFs and generate detailed HTML pages.
 """
 
+import argparse
 import os
-import re
 import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-import fitz  # PyMuPDF
 import json
+from answer_key import ANSWER_PDFS, HEADING_RE, heading_key, load_answer_key, question_number
+from instrument import count, enable, finish_trace, span, traced
+from dedupe_questions import DEFAULT_THRESHOLD, iter_unique
+from page_writer import write_pages
+from pdf_text import iter_page_chunks, iter_pages, page_at, shard_pages
+from question_scanner import BOUNDARY_RE, merge_overlapping, scan
+from site_assets import PROBLEM_STYLESHEET, write_stylesheet
+from site_index import write_site_indexes
+from topic_matcher import rank_topics
 
-def extract_text_pymupdf(pdf_path):
-    """Extract text using PyMuPDF (fitz)."""
-    try:
-        doc = fitz.open(pdf_path)
-        text = ""
-        for page_num in range(doc.page_count):
-            page = doc[page_num]
-            text += page.get_text() + "\n"
-        doc.close()
-        return text
-    except Exception as e:
-        print(f"PyMuPDF failed for {pdf_path}: {e}")
-        return None
+def extract_questions_and_solutions(pages, pdf_name):
+    """Extract questions and solutions from a stream of (page_number, text) pages.
 
-def extract_questions_and_solutions(text, pdf_name):
-    """Extract questions and solutions from text content."""
-    if not text:
-        return []
-    
-    problems = []
-    
-    # Enhanced patterns for questions and solutions
-    patterns = [
-        # Exercise questions with solutions
-        r'(?:^|\n)\s*(\d+[\.\)]\s+[^?\n]+\?)\s*(.*?)(?=\n\s*\d+[\.\)]|\n\s*$|\Z)',
-        r'(?:^|\n)\s*Problem\s+(\d+\.\d+)[:\s]+([^?\n]+\?)\s*(.*?)(?=\n\s*Problem|\n\s*$|\Z)',
-        r'(?:^|\n)\s*Example\s+(\d+)[:\s]+([^?\n]+\?)\s*(.*?)(?=\n\s*Example|\n\s*$|\Z)',
-        r'(?:^|\n)\s*Q(\d+)[\.\)]\s+([^?\n]+\?)\s*(.*?)(?=\n\s*Q\d+|\n\s*$|\Z)',
-    ]
-    
-    for pattern in patterns:
-        matches = re.finditer(pattern, text, re.MULTILINE | re.IGNORECASE | re.DOTALL)
+    Each question is tagged with the (chapter, exercise) of the last exercise
+    heading before it and its number, the key of its answer in the answer key.
+    """
+    section = (None, '')
+    # Chunks are only split at question boundaries, so a question is always scanned in one piece
+    for chunk, page_starts in iter_page_chunks(pages, BOUNDARY_RE):
+        with span("scan chunk", source=pdf_name):
+            matches = list(merge_overlapping(scan(chunk)))
+        count("questions matched", len(matches))
+        headings = [(heading.start(), heading_key(heading)) for heading in HEADING_RE.finditer(chunk)]
         for match in matches:
-            if len(match.groups()) >= 2:
-                question_text = match.group(1).strip() if match.group(1) else match.group(2).strip()
-                solution_text = match.group(2).strip() if len(match.groups()) >= 2 and match.group(2) else ""
-                if len(match.groups()) >= 3:
-                    solution_text = match.group(3).strip()
-                
-                if len(question_text) > 10:  # Filter out very short matches
-                    problems.append({
-                        'question': question_text,
-                        'solution': solution_text,
-                        'source': pdf_name,
-                        'pattern': pattern
-                    })
-    
-    return problems
+            while headings and headings[0][0] < match['start']:
+                section = headings.pop(0)[1]
+            if len(match['question']) > 10:  # Filter out very short matches
+                yield {
+                    'question': match['question'],
+                    'solution': match['solution'],
+                    'source': pdf_name,
+                    'page': page_at(page_starts, match['start']),
+                    'rule': match['rule'],
+                    'chapter': section[0],
+                    'exercise': section[1],
+                    'number': question_number(match['question'])
+                }
+        if headings:
+            section = headings[-1][1]
 
 def get_chapter_info(pdf_name):
     """Get chapter information based on PDF name."""
@@ -70,8 +61,7 @@ def get_chapter_info(pdf_name):
         'lemh106': {'title': 'Linear Inequalities', 'chapter': 6, 'topics': ['linear inequalities', 'graphing', 'systems', 'optimization', 'feasible region']},
         'lemh1a1': {'title': 'Mathematical Induction', 'chapter': 'A1', 'topics': ['mathematical induction', 'base case', 'inductive step', 'proof by induction']},
         'lemh1a2': {'title': 'Mathematical Induction (Advanced)', 'chapter': 'A2', 'topics': ['advanced induction', 'strong induction', 'recursive sequences', 'inductive proofs']},
-        'lemh1ps': {'title': 'Problem Solving', 'chapter': 'PS', 'topics': ['problem solving strategies', 'mathematical reasoning', 'proof techniques']},
-        'lemh1an': {'title': 'Answers', 'chapter': 'AN', 'topics': ['answers', 'solutions', 'verification']}
+        'lemh1ps': {'title': 'Problem Solving', 'chapter': 'PS', 'topics': ['problem solving strategies', 'mathematical reasoning', 'proof techniques']}
     }
     
     base_name = pdf_name.replace('.pdf', '')
@@ -117,12 +107,8 @@ def generate_background_concept(chapter_info, problem_text):
         """
     }
     
-    # Find relevant topics in the problem
-    relevant_topics = []
-    problem_lower = problem_text.lower()
-    for topic in topics:
-        if any(keyword in problem_lower for keyword in topic.split()):
-            relevant_topics.append(topic)
+    # Find relevant topics in the problem, most mentioned first
+    relevant_topics = [topic for topic, _ in rank_topics(topics, problem_text)]
     
     if not relevant_topics:
         relevant_topics = topics[:2]  # Default to first two topics
@@ -132,9 +118,9 @@ def generate_background_concept(chapter_info, problem_text):
     <p>This problem involves concepts from Chapter {chapter}: {title}. The key mathematical concepts include:</p>
     """
     
-    for topic in relevant_topics[:3]:  # Limit to 3 topics
-        if topic in topic_explanations:
-            background += f"<h3>{topic.title()}</h3><p>{topic_explanations[topic].strip()}</p>"
+    explained_topics = [topic for topic in relevant_topics if topic in topic_explanations]
+    for topic in explained_topics[:3]:  # Limit to 3 topics
+        background += f"<h3>{topic.title()}</h3><p>{topic_explanations[topic].strip()}</p>"
     
     return background
 
@@ -194,6 +180,7 @@ def generate_tips_to_solve(chapter_info, problem_text):
     
     return tips_html
 
+@traced("render page")
 def generate_html_page(problem, chapter_info, problem_number):
     """Generate a complete HTML page for a problem."""
     title = chapter_info['title']
@@ -205,20 +192,7 @@ def generate_html_page(problem, chapter_info, problem_number):
   <meta charset="utf-8" />
   <meta name="viewport" content="width=device-width, initial-scale=1" />
   <title>Ch {chapter} Problem {problem_number} — {title}</title>
-  <style>
-    body {{ margin:0; font-family: ui-sans-serif, system-ui, -apple-system, Segoe UI, Roboto, Helvetica, Arial; background:#ffffff; color:#111827; line-height:1.55; }}
-    .container {{ max-width: 960px; margin:0 auto; padding:24px; }}
-    h1 {{ margin:0 0 8px; font-size:26px; color:#38bdf8; }}
-    h2 {{ margin:18px 0 8px; font-size:20px; color:#a78bfa; }}
-    h3 {{ margin:16px 0 6px; font-size:18px; color:#7c3aed; }}
-    .panel {{ background:#ffffff; border:1px solid #e5e7eb; border-radius:10px; padding:16px; margin:16px 0; }}
-    .q {{ border-left:3px solid #f59e0b; padding-left:10px; }}
-    .solution {{ border-left:3px solid #10b981; padding-left:10px; background:#f0fdf4; }}
-    code {{ background:#f8fafc; border:1px solid #e5e7eb; padding:2px 6px; border-radius:6px; }}
-    .muted {{ color:#374151; }}
-    ul {{ margin:8px 0 8px 20px; }}
-    li {{ margin:4px 0; }}
-  </style>
+  {PROBLEM_STYLESHEET}
 </head>
 <body>
   <div class="container">
@@ -239,7 +213,7 @@ def generate_html_page(problem, chapter_info, problem_number):
 
     <div class="panel">
       <h2>Source</h2>
-      <p class="muted">Extracted from: {problem['source']}</p>
+      <p class="muted">Extracted from: {problem['source']}, page {problem['page']}{f"; answer from {problem['answer_source']}" if problem.get('answer_source') else ''}</p>
     </div>
   </div>
 </body>
@@ -247,50 +221,115 @@ def generate_html_page(problem, chapter_info, problem_number):
     
     return html
 
-def process_pdf(pdf_path):
-    """Process a single PDF file and generate HTML pages."""
+def iter_pdf_problems(pdf_path, pages=None, answer_pdf=None, layout=False):
+    """Yield the problems of a single PDF file, or of its already streaming pages.
+
+    With answer_pdf, each problem found in its answer key gets that answer as its solution.
+    """
     pdf_name = os.path.basename(pdf_path)
     chapter_info = get_chapter_info(pdf_name)
+    answers = load_answer_key(answer_pdf) if answer_pdf else {}
     
     print(f"Processing {pdf_name}...")
     
-    text = extract_text_pymupdf(pdf_path)
-    if not text:
-        print(f"Could not extract text from {pdf_name}")
-        return []
-    
-    problems = extract_questions_and_solutions(text, pdf_name)
-    print(f"Found {len(problems)} problems in {pdf_name}")
-    
-    # Create output directory
-    chapter_dir = Path(f"Maths/ch{chapter_info['chapter']}")
-    chapter_dir.mkdir(parents=True, exist_ok=True)
+    found = 0
+    try:
+        for problem in extract_questions_and_solutions(pages if pages is not None else iter_pages(pdf_path, layout=layout), pdf_name):
+            answer = answers.get((problem['chapter'] or chapter_info['chapter'], problem['exercise'], problem['number']))
+            if answer:
+                problem['solution'] = answer
+                problem['answer_source'] = os.path.basename(answer_pdf)
+            found += 1
+            yield problem
+    except Exception as e:
+        print(f"Could not extract text from {pdf_name}: {e}")
     
-    # Generate HTML pages
-    for i, problem in enumerate(problems, 1):
-        html_content = generate_html_page(problem, chapter_info, i)
-        output_file = chapter_dir / f"problem-{chapter_info['chapter']}-{i:02d}.html"
-        
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(html_content)
+    print(f"Found {found} problems in {pdf_name}")
+
+def extract_problems(pdf_files, jobs=1, answer_pdf=None, layout=False):
+    """Yield the problems of the PDFs in order, parsing their pages on a process pool when jobs > 1."""
+    if jobs <= 1:
+        for pdf_path in pdf_files:
+            yield from iter_pdf_problems(pdf_path, answer_pdf=answer_pdf, layout=layout)
+        return
     
-    return problems
+    # Every PDF is split into page slices queued up front, so one large book no
+    # longer holds back the run; scanning and writing stay here, in page order.
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        sources = [shard_pages(pdf_path, executor, jobs, layout=layout) for pdf_path in pdf_files]
+        for pdf_path, pages in zip(pdf_files, sources):
+            yield from iter_pdf_problems(pdf_path, pages, answer_pdf)
+
+def render_problems(problems):
+    """Number each chapter's problems; yield (output_file, html_content, index_record).
+
+    The record is (chapter, number, title, href), enough to list the page in
+    an index, so the problem itself can be dropped once its page is written.
+    """
+    numbers = {}
+    for problem in problems:
+        chapter_info = get_chapter_info(problem['source'])
+        chapter = chapter_info['chapter']
+        number = numbers[chapter] = numbers.get(chapter, 0) + 1
+        href = f"ch{chapter}/problem-{chapter}-{number:02d}.html"
+        record = (problem['source'].replace('.pdf', ''), number, problem['question'][:60], href)
+        yield Path("Maths") / href, generate_html_page(problem, chapter_info, number), record
+
+def write_problem_pages(rendered):
+    """Write each rendered page; yield its index record once the page is written."""
+    records = deque()
+    def pages():
+        for output_file, html_content, record in rendered:
+            records.append(record)
+            yield output_file, html_content
+    for _ in write_pages(pages()):
+        yield records.popleft()
+
+def parse_args():
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description=__doc__.strip())
+    parser.add_argument('-j', '--jobs', type=int, default=1,
+                        help='number of processes parsing PDF pages (default: 1, 0 = one per CPU)')
+    parser.add_argument('-t', '--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help=f'skip questions at least this similar to one already written (default: {DEFAULT_THRESHOLD})')
+    parser.add_argument('--layout', action='store_true',
+                        help='read pages in layout order (columns, margin notes) instead of as flat text')
+    parser.add_argument('--trace', metavar='FILE',
+                        help='write a Chrome trace of the run to FILE and print a timing summary')
+    args = parser.parse_args()
+    if args.trace:
+        enable(args.trace)
+    if args.jobs == 0:
+        args.jobs = os.cpu_count() or 1
+    return args
 
 def main():
     """Main function to process all PDFs."""
-    maths_dir = Path("D:/repository/research/Maths")
+    args = parse_args()
+    try:
+        write_stylesheet()
+        maths_dir = Path("D:/repository/research/Maths")
+    
+        # Find all PDF files (sorted so serial and parallel runs see the same order)
+        pdf_files = sorted(maths_dir.rglob("*.pdf"))
+        print(f"Found {len(pdf_files)} PDF files")
     
-    all_problems = []
+        # The answers PDF is not a chapter: it is indexed and its answers become the solutions
+        answer_pdf = next((pdf for pdf in pdf_files if pdf.name in ANSWER_PDFS), None)
+        pdf_files = [pdf for pdf in pdf_files if pdf.name not in ANSWER_PDFS]
     
-    # Find all PDF files
-    pdf_files = list(maths_dir.rglob("*.pdf"))
-    print(f"Found {len(pdf_files)} PDF files")
+        # extract -> dedupe -> render -> write, one problem at a time
+        problems = extract_problems(pdf_files, args.jobs, answer_pdf, args.layout)
+        problems = iter_unique(problems, lambda problem: problem['question'], args.threshold)
+        total = sum(1 for _ in write_problem_pages(render_problems(problems)))
     
-    for pdf_path in pdf_files:
-        problems = process_pdf(pdf_path)
-        all_problems.extend(problems)
+        # Only the chapters whose pages changed are indexed again
+        pages, rendered = write_site_indexes(['maths'])['maths']
+        print(f"Maths index: {pages} problems, {rendered} chapters rendered")
     
-    print(f"Extraction complete! Generated HTML pages for {len(all_problems)} problems total.")
+        print(f"Extraction complete! Generated HTML pages for {total} problems total.")
+    finally:
+        finish_trace()  # no-op unless --trace was given
 
 if __name__ == "__main__":
     main()
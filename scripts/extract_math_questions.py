@@ -4,75 +4,43 @@ Extract questions from all PDFs in the Maths folder and generate an index.
 """
 
 import os
-import re
 import sys
 from pathlib import Path
 import PyPDF2
-import fitz  # PyMuPDF
+from pdf_text import iter_page_chunks, iter_pages, page_at
+from question_scanner import DIRECT_BOUNDARY_RE, merge_overlapping, scan
 
-def extract_text_pypdf2(pdf_path):
-    """Extract text using PyPDF2."""
+def extract_pages_pypdf2(pdf_path):
+    """Extract (page_number, text) pages using PyPDF2."""
     try:
         with open(pdf_path, 'rb') as file:
             reader = PyPDF2.PdfReader(file)
-            text = ""
-            for page in reader.pages:
-                text += page.extract_text() + "\n"
-        return text
+            return [(page_num, page.extract_text()) for page_num, page in enumerate(reader.pages, 1)]
     except Exception as e:
         print(f"PyPDF2 failed for {pdf_path}: {e}")
         return None
 
-def extract_text_pymupdf(pdf_path):
-    """Extract text using PyMuPDF (fitz)."""
+def extract_pages_pymupdf(pdf_path):
+    """Extract (page_number, text) pages using PyMuPDF (fitz), reusing cached page text for unchanged PDFs."""
     try:
-        doc = fitz.open(pdf_path)
-        text = ""
-        for page_num in range(doc.page_count):
-            page = doc[page_num]
-            text += page.get_text() + "\n"
-        doc.close()
-        return text
+        return list(iter_pages(pdf_path))
     except Exception as e:
         print(f"PyMuPDF failed for {pdf_path}: {e}")
         return None
 
-def extract_questions_from_text(text, pdf_name):
-    """Extract questions from text content."""
-    if not text:
-        return []
-    
-    questions = []
-    
-    # Common question patterns
-    patterns = [
-        # Exercise questions: "1. Question text..." or "Q1. Question text..."
-        r'(?:^|\n)\s*(?:Exercise\s+)?(\d+[\.\)]\s+[^?\n]+\?)',
-        r'(?:^|\n)\s*Q(\d+)[\.\)]\s+([^?\n]+\?)',
-        r'(?:^|\n)\s*(\d+[\.\)]\s+[^?\n]+\?)',
-        
-        # Problem patterns: "Problem 1.1: Question text..."
-        r'(?:^|\n)\s*Problem\s+(\d+\.\d+)[:\s]+([^?\n]+\?)',
-        
-        # Example patterns: "Example 1: Question text..."
-        r'(?:^|\n)\s*Example\s+(\d+)[:\s]+([^?\n]+\?)',
-        
-        # Direct question patterns
-        r'(?:^|\n)\s*([A-Z][^?\n]+\?)',
-    ]
-    
-    for pattern in patterns:
-        matches = re.finditer(pattern, text, re.MULTILINE | re.IGNORECASE)
-        for match in matches:
-            question_text = match.group(0).strip()
-            if len(question_text) > 10:  # Filter out very short matches
-                questions.append({
-                    'text': question_text,
+def extract_questions_from_text(pages, pdf_name):
+    """Extract questions from a stream of (page_number, text) pages."""
+    # Chunks are only split at question boundaries, so a question running over a
+    # page break is scanned in one piece, with the page it starts on
+    for chunk, page_starts in iter_page_chunks(pages, DIRECT_BOUNDARY_RE):
+        for match in merge_overlapping(scan(chunk, include_direct=True)):
+            if len(match['question']) > 10:  # Filter out very short matches
+                yield {
+                    'text': match['question'],
                     'source': pdf_name,
-                    'pattern': pattern
-                })
-    
-    return questions
+                    'page': page_at(page_starts, match['start']),
+                    'rule': match['rule']
+                }
 
 def process_pdf(pdf_path):
     """Process a single PDF file."""
@@ -80,16 +48,16 @@ def process_pdf(pdf_path):
     print(f"Processing {pdf_name}...")
     
     # Try PyMuPDF first (usually better)
-    text = extract_text_pymupdf(pdf_path)
-    if not text or len(text.strip()) < 100:
+    pages = extract_pages_pymupdf(pdf_path)
+    if not pages or sum(len(text.strip()) for _, text in pages) < 100:
         # Fallback to PyPDF2
-        text = extract_text_pypdf2(pdf_path)
+        pages = extract_pages_pypdf2(pdf_path)
     
-    if not text:
+    if not pages:
         print(f"Could not extract text from {pdf_name}")
         return []
     
-    questions = extract_questions_from_text(text, pdf_name)
+    questions = list(extract_questions_from_text(pages, pdf_name))
     print(f"Found {len(questions)} questions in {pdf_name}")
     return questions
 
@@ -126,7 +94,7 @@ def main():
             f.write("-" * 30 + "\n")
             
             for i, q in enumerate(questions, 1):
-                f.write(f"Question {i}:\n")
+                f.write(f"Question {i} (page {q['page']}):\n")
                 f.write(f"{q['text']}\n\n")
             
             f.write("\n" + "=" * 50 + "\n\n")
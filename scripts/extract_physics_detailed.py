@@ -3,62 +3,53 @@
 Extract questions and solutions from Physics PDFs and generate detailed HTML pages.
 """
 
+import argparse
 import os
-import re
 import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-import fitz  # PyMuPDF
 import json
+from answer_key import ANSWER_PDFS, HEADING_RE, heading_key, load_answer_key, question_number
+from instrument import count, enable, finish_trace, span, traced
+from dedupe_questions import DEFAULT_THRESHOLD, iter_unique
+from page_writer import write_pages
+from pdf_text import iter_page_chunks, iter_pages, page_at, shard_pages
+from question_scanner import BOUNDARY_RE, merge_overlapping, scan
+from site_assets import PROBLEM_STYLESHEET, write_stylesheet
+from site_index import write_site_indexes
+from svg_sprites import sprite_reference, write_sprite_sheet
+from topic_matcher import rank_topics
 
-def extract_text_pymupdf(pdf_path):
-    """Extract text using PyMuPDF (fitz)."""
-    try:
-        doc = fitz.open(pdf_path)
-        text = ""
-        for page_num in range(doc.page_count):
-            page = doc[page_num]
-            text += page.get_text() + "\n"
-        doc.close()
-        return text
-    except Exception as e:
-        print(f"PyMuPDF failed for {pdf_path}: {e}")
-        return None
+def extract_questions_and_solutions(pages, pdf_name):
+    """Extract questions and solutions from a stream of (page_number, text) pages.
 
-def extract_questions_and_solutions(text, pdf_name):
-    """Extract questions and solutions from text content."""
-    if not text:
-        return []
-    
-    problems = []
-    
-    # Enhanced patterns for physics questions and solutions
-    patterns = [
-        # Exercise questions with solutions
-        r'(?:^|\n)\s*(\d+[\.\)]\s+[^?\n]+\?)\s*(.*?)(?=\n\s*\d+[\.\)]|\n\s*$|\Z)',
-        r'(?:^|\n)\s*Problem\s+(\d+\.\d+)[:\s]+([^?\n]+\?)\s*(.*?)(?=\n\s*Problem|\n\s*$|\Z)',
-        r'(?:^|\n)\s*Example\s+(\d+)[:\s]+([^?\n]+\?)\s*(.*?)(?=\n\s*Example|\n\s*$|\Z)',
-        r'(?:^|\n)\s*Q(\d+)[\.\)]\s+([^?\n]+\?)\s*(.*?)(?=\n\s*Q\d+|\n\s*$|\Z)',
-        r'(?:^|\n)\s*(\d+[\.\)]\s+[^?\n]+(?:calculate|find|determine|show|prove|derive)[^?\n]*\?)\s*(.*?)(?=\n\s*\d+[\.\)]|\n\s*$|\Z)',
-    ]
-    
-    for pattern in patterns:
-        matches = re.finditer(pattern, text, re.MULTILINE | re.IGNORECASE | re.DOTALL)
+    Each question is tagged with the (chapter, exercise) of the last exercise
+    heading before it and its number, the key of its answer in the answer key.
+    """
+    section = (None, '')
+    # Chunks are only split at question boundaries, so a question is always scanned in one piece
+    for chunk, page_starts in iter_page_chunks(pages, BOUNDARY_RE):
+        with span("scan chunk", source=pdf_name):
+            matches = list(merge_overlapping(scan(chunk)))
+        count("questions matched", len(matches))
+        headings = [(heading.start(), heading_key(heading)) for heading in HEADING_RE.finditer(chunk)]
         for match in matches:
-            if len(match.groups()) >= 2:
-                question_text = match.group(1).strip() if match.group(1) else match.group(2).strip()
-                solution_text = match.group(2).strip() if len(match.groups()) >= 2 and match.group(2) else ""
-                if len(match.groups()) >= 3:
-                    solution_text = match.group(3).strip()
-                
-                if len(question_text) > 10:  # Filter out very short matches
-                    problems.append({
-                        'question': question_text,
-                        'solution': solution_text,
-                        'source': pdf_name,
-                        'pattern': pattern
-                    })
-    
-    return problems
+            while headings and headings[0][0] < match['start']:
+                section = headings.pop(0)[1]
+            if len(match['question']) > 10:  # Filter out very short matches
+                yield {
+                    'question': match['question'],
+                    'solution': match['solution'],
+                    'source': pdf_name,
+                    'page': page_at(page_starts, match['start']),
+                    'rule': match['rule'],
+                    'chapter': section[0],
+                    'exercise': section[1],
+                    'number': question_number(match['question'])
+                }
+        if headings:
+            section = headings[-1][1]
 
 def get_chapter_info(pdf_name):
     """Get chapter information based on PDF name."""
@@ -71,8 +62,7 @@ def get_chapter_info(pdf_name):
         'leph106': {'title': 'Gravitation', 'chapter': 6, 'topics': ['gravitation', 'kepler laws', 'orbital motion', 'escape velocity', 'satellites', 'weightlessness']},
         'leph107': {'title': 'Properties of Bulk Matter', 'chapter': 7, 'topics': ['elasticity', 'viscosity', 'surface tension', 'fluid mechanics', 'bernoulli principle', 'archimedes principle']},
         'leph108': {'title': 'Thermodynamics', 'chapter': 8, 'topics': ['heat', 'temperature', 'thermal expansion', 'heat transfer', 'laws of thermodynamics', 'entropy']},
-        'leph1ps': {'title': 'Problem Solving', 'chapter': 'PS', 'topics': ['problem solving strategies', 'mathematical reasoning', 'physics concepts']},
-        'leph1an': {'title': 'Answers', 'chapter': 'AN', 'topics': ['answers', 'solutions', 'verification']}
+        'leph1ps': {'title': 'Problem Solving', 'chapter': 'PS', 'topics': ['problem solving strategies', 'mathematical reasoning', 'physics concepts']}
     }
     
     base_name = pdf_name.replace('.pdf', '')
@@ -121,12 +111,8 @@ def generate_background_concept(chapter_info, problem_text):
         """
     }
     
-    # Find relevant topics in the problem
-    relevant_topics = []
-    problem_lower = problem_text.lower()
-    for topic in topics:
-        if any(keyword in problem_lower for keyword in topic.split()):
-            relevant_topics.append(topic)
+    # Find relevant topics in the problem, most mentioned first
+    relevant_topics = [topic for topic, _ in rank_topics(topics, problem_text)]
     
     if not relevant_topics:
         relevant_topics = topics[:2]  # Default to first two topics
@@ -136,105 +122,107 @@ def generate_background_concept(chapter_info, problem_text):
     <p>This problem involves fundamental concepts from Chapter {chapter}: {title}. Understanding these concepts is crucial for solving physics problems systematically.</p>
     """
     
-    for topic in relevant_topics[:2]:  # Limit to 2 topics for detailed explanation
-        if topic in topic_explanations:
-            background += f"<div class='concept-section'><h3>{topic.title()}</h3><p>{topic_explanations[topic]}</p></div>"
+    explained_topics = [topic for topic in relevant_topics if topic in topic_explanations]
+    for topic in explained_topics[:2]:  # Limit to 2 topics for detailed explanation
+        background += f"<div class='concept-section'><h3>{topic.title()}</h3><p>{topic_explanations[topic]}</p></div>"
     
     return background
 
+EXTRACTED_SHEET = "physics-diagrams.svg"
+
+# Per-chapter diagrams, drawn into every page from the EXTRACTED_SHEET sprite sheet.
+CHAPTER_VISUALIZATIONS = {
+    1: """<svg viewBox="0 0 400 200" class="physics-diagram">
+        <defs>
+            <marker id="arrowhead" markerWidth="10" markerHeight="7" refX="9" refY="3.5" orient="auto">
+                <polygon points="0 0, 10 3.5, 0 7" fill="#3b82f6" />
+            </marker>
+        </defs>
+        <rect x="50" y="50" width="300" height="100" fill="#f3f4f6" stroke="#6b7280" stroke-width="2"/>
+        <text x="200" y="80" text-anchor="middle" font-size="14" fill="#374151">Measurement and Units</text>
+        <text x="200" y="100" text-anchor="middle" font-size="12" fill="#6b7280">Length (m), Mass (kg), Time (s)</text>
+        <text x="200" y="120" text-anchor="middle" font-size="12" fill="#6b7280">Dimensional Analysis: [M]ᵃ[L]ᵇ[T]ᶜ</text>
+        <line x1="100" y1="140" x2="300" y2="140" stroke="#3b82f6" stroke-width="2" marker-end="url(#arrowhead)"/>
+        <text x="200" y="160" text-anchor="middle" font-size="12" fill="#3b82f6">Physical Quantities</text>
+    </svg>""",
+    
+    2: """<svg viewBox="0 0 400 250" class="physics-diagram">
+        <defs>
+            <marker id="arrowhead2" markerWidth="10" markerHeight="7" refX="9" refY="3.5" orient="auto">
+                <polygon points="0 0, 10 3.5, 0 7" fill="#ef4444" />
+            </marker>
+        </defs>
+        <line x1="50" y1="200" x2="350" y2="200" stroke="#374151" stroke-width="2"/>
+        <circle cx="100" cy="200" r="8" fill="#ef4444"/>
+        <path d="M 100 200 Q 200 100 300 200" stroke="#ef4444" stroke-width="3" fill="none"/>
+        <text x="100" y="190" text-anchor="middle" font-size="12" fill="#ef4444">v₀</text>
+        <text x="200" y="90" text-anchor="middle" font-size="12" fill="#ef4444">Projectile Path</text>
+        <text x="300" y="190" text-anchor="middle" font-size="12" fill="#ef4444">Range</text>
+        <line x1="100" y1="200" x2="120" y2="180" stroke="#ef4444" stroke-width="2" marker-end="url(#arrowhead2)"/>
+        <text x="130" y="175" font-size="10" fill="#ef4444">θ</text>
+    </svg>""",
+    
+    3: """<svg viewBox="0 0 400 200" class="physics-diagram">
+        <rect x="50" y="50" width="80" height="60" fill="#fbbf24" stroke="#f59e0b" stroke-width="2"/>
+        <text x="90" y="85" text-anchor="middle" font-size="12" fill="#92400e">Mass m</text>
+        <line x1="130" y1="80" x2="200" y2="80" stroke="#3b82f6" stroke-width="3" marker-end="url(#arrowhead)"/>
+        <text x="165" y="75" font-size="12" fill="#3b82f6">F = ma</text>
+        <text x="200" y="100" font-size="14" fill="#374151">Newton's Second Law</text>
+        <text x="200" y="120" font-size="12" fill="#6b7280">Force causes acceleration</text>
+    </svg>""",
+    
+    4: """<svg viewBox="0 0 400 200" class="physics-diagram">
+        <circle cx="100" cy="100" r="30" fill="#10b981" stroke="#059669" stroke-width="2"/>
+        <text x="100" y="105" text-anchor="middle" font-size="12" fill="white">KE</text>
+        <circle cx="300" cy="100" r="30" fill="#8b5cf6" stroke="#7c3aed" stroke-width="2"/>
+        <text x="300" y="105" text-anchor="middle" font-size="12" fill="white">PE</text>
+        <line x1="130" y1="100" x2="270" y2="100" stroke="#374151" stroke-width="2" marker-end="url(#arrowhead)"/>
+        <text x="200" y="90" font-size="12" fill="#374151">Energy Conservation</text>
+        <text x="200" y="140" font-size="12" fill="#6b7280">KE + PE = Constant</text>
+    </svg>""",
+    
+    5: """<svg viewBox="0 0 400 200" class="physics-diagram">
+        <circle cx="200" cy="100" r="40" fill="#f3f4f6" stroke="#6b7280" stroke-width="2"/>
+        <circle cx="200" cy="100" r="3" fill="#ef4444"/>
+        <text x="200" y="95" text-anchor="middle" font-size="10" fill="#ef4444">CM</text>
+        <line x1="200" y1="100" x2="250" y2="100" stroke="#3b82f6" stroke-width="2" marker-end="url(#arrowhead)"/>
+        <text x="225" y="90" font-size="10" fill="#3b82f6">ω</text>
+        <text x="200" y="160" text-anchor="middle" font-size="12" fill="#374151">Rotational Motion</text>
+        <text x="200" y="175" text-anchor="middle" font-size="10" fill="#6b7280">τ = Iα</text>
+    </svg>""",
+    
+    6: """<svg viewBox="0 0 400 200" class="physics-diagram">
+        <circle cx="200" cy="100" r="20" fill="#fbbf24" stroke="#f59e0b" stroke-width="2"/>
+        <text x="200" y="105" text-anchor="middle" font-size="10" fill="#92400e">M</text>
+        <ellipse cx="200" cy="100" rx="80" ry="40" fill="none" stroke="#3b82f6" stroke-width="2" stroke-dasharray="5,5"/>
+        <text x="200" y="160" text-anchor="middle" font-size="12" fill="#374151">Gravitational Orbit</text>
+        <text x="200" y="175" text-anchor="middle" font-size="10" fill="#6b7280">F = GMm/r²</text>
+    </svg>""",
+    
+    7: """<svg viewBox="0 0 400 200" class="physics-diagram">
+        <rect x="50" y="80" width="300" height="40" fill="#3b82f6" opacity="0.3"/>
+        <line x1="200" y1="60" x2="200" y2="140" stroke="#ef4444" stroke-width="2" marker-end="url(#arrowhead)"/>
+        <text x="210" y="100" font-size="10" fill="#ef4444">P = ρgh</text>
+        <text x="200" y="160" text-anchor="middle" font-size="12" fill="#374151">Fluid Pressure</text>
+        <text x="200" y="175" text-anchor="middle" font-size="10" fill="#6b7280">Pressure increases with depth</text>
+    </svg>""",
+    
+    8: """<svg viewBox="0 0 400 200" class="physics-diagram">
+        <rect x="50" y="50" width="100" height="100" fill="#fbbf24" stroke="#f59e0b" stroke-width="2"/>
+        <text x="100" y="105" text-anchor="middle" font-size="12" fill="#92400e">Hot</text>
+        <rect x="250" y="50" width="100" height="100" fill="#3b82f6" stroke="#2563eb" stroke-width="2"/>
+        <text x="300" y="105" text-anchor="middle" font-size="12" fill="white">Cold</text>
+        <line x1="150" y1="100" x2="250" y2="100" stroke="#ef4444" stroke-width="3" marker-end="url(#arrowhead)"/>
+        <text x="200" y="90" font-size="12" fill="#ef4444">Heat Flow</text>
+        <text x="200" y="170" text-anchor="middle" font-size="12" fill="#374151">Thermodynamics</text>
+    </svg>"""
+}
+
 def generate_visualization(chapter_info, problem_text):
     """Generate SVG visualizations for physics concepts."""
     chapter = chapter_info['chapter']
-    title = chapter_info['title']
-    
-    visualizations = {
-        1: """<svg viewBox="0 0 400 200" class="physics-diagram">
-            <defs>
-                <marker id="arrowhead" markerWidth="10" markerHeight="7" refX="9" refY="3.5" orient="auto">
-                    <polygon points="0 0, 10 3.5, 0 7" fill="#3b82f6" />
-                </marker>
-            </defs>
-            <rect x="50" y="50" width="300" height="100" fill="#f3f4f6" stroke="#6b7280" stroke-width="2"/>
-            <text x="200" y="80" text-anchor="middle" font-size="14" fill="#374151">Measurement and Units</text>
-            <text x="200" y="100" text-anchor="middle" font-size="12" fill="#6b7280">Length (m), Mass (kg), Time (s)</text>
-            <text x="200" y="120" text-anchor="middle" font-size="12" fill="#6b7280">Dimensional Analysis: [M]ᵃ[L]ᵇ[T]ᶜ</text>
-            <line x1="100" y1="140" x2="300" y2="140" stroke="#3b82f6" stroke-width="2" marker-end="url(#arrowhead)"/>
-            <text x="200" y="160" text-anchor="middle" font-size="12" fill="#3b82f6">Physical Quantities</text>
-        </svg>""",
-        
-        2: """<svg viewBox="0 0 400 250" class="physics-diagram">
-            <defs>
-                <marker id="arrowhead2" markerWidth="10" markerHeight="7" refX="9" refY="3.5" orient="auto">
-                    <polygon points="0 0, 10 3.5, 0 7" fill="#ef4444" />
-                </marker>
-            </defs>
-            <line x1="50" y1="200" x2="350" y2="200" stroke="#374151" stroke-width="2"/>
-            <circle cx="100" cy="200" r="8" fill="#ef4444"/>
-            <path d="M 100 200 Q 200 100 300 200" stroke="#ef4444" stroke-width="3" fill="none"/>
-            <text x="100" y="190" text-anchor="middle" font-size="12" fill="#ef4444">v₀</text>
-            <text x="200" y="90" text-anchor="middle" font-size="12" fill="#ef4444">Projectile Path</text>
-            <text x="300" y="190" text-anchor="middle" font-size="12" fill="#ef4444">Range</text>
-            <line x1="100" y1="200" x2="120" y2="180" stroke="#ef4444" stroke-width="2" marker-end="url(#arrowhead2)"/>
-            <text x="130" y="175" font-size="10" fill="#ef4444">θ</text>
-        </svg>""",
-        
-        3: """<svg viewBox="0 0 400 200" class="physics-diagram">
-            <rect x="50" y="50" width="80" height="60" fill="#fbbf24" stroke="#f59e0b" stroke-width="2"/>
-            <text x="90" y="85" text-anchor="middle" font-size="12" fill="#92400e">Mass m</text>
-            <line x1="130" y1="80" x2="200" y2="80" stroke="#3b82f6" stroke-width="3" marker-end="url(#arrowhead)"/>
-            <text x="165" y="75" font-size="12" fill="#3b82f6">F = ma</text>
-            <text x="200" y="100" font-size="14" fill="#374151">Newton's Second Law</text>
-            <text x="200" y="120" font-size="12" fill="#6b7280">Force causes acceleration</text>
-        </svg>""",
-        
-        4: """<svg viewBox="0 0 400 200" class="physics-diagram">
-            <circle cx="100" cy="100" r="30" fill="#10b981" stroke="#059669" stroke-width="2"/>
-            <text x="100" y="105" text-anchor="middle" font-size="12" fill="white">KE</text>
-            <circle cx="300" cy="100" r="30" fill="#8b5cf6" stroke="#7c3aed" stroke-width="2"/>
-            <text x="300" y="105" text-anchor="middle" font-size="12" fill="white">PE</text>
-            <line x1="130" y1="100" x2="270" y2="100" stroke="#374151" stroke-width="2" marker-end="url(#arrowhead)"/>
-            <text x="200" y="90" font-size="12" fill="#374151">Energy Conservation</text>
-            <text x="200" y="140" font-size="12" fill="#6b7280">KE + PE = Constant</text>
-        </svg>""",
-        
-        5: """<svg viewBox="0 0 400 200" class="physics-diagram">
-            <circle cx="200" cy="100" r="40" fill="#f3f4f6" stroke="#6b7280" stroke-width="2"/>
-            <circle cx="200" cy="100" r="3" fill="#ef4444"/>
-            <text x="200" y="95" text-anchor="middle" font-size="10" fill="#ef4444">CM</text>
-            <line x1="200" y1="100" x2="250" y2="100" stroke="#3b82f6" stroke-width="2" marker-end="url(#arrowhead)"/>
-            <text x="225" y="90" font-size="10" fill="#3b82f6">ω</text>
-            <text x="200" y="160" text-anchor="middle" font-size="12" fill="#374151">Rotational Motion</text>
-            <text x="200" y="175" text-anchor="middle" font-size="10" fill="#6b7280">τ = Iα</text>
-        </svg>""",
-        
-        6: """<svg viewBox="0 0 400 200" class="physics-diagram">
-            <circle cx="200" cy="100" r="20" fill="#fbbf24" stroke="#f59e0b" stroke-width="2"/>
-            <text x="200" y="105" text-anchor="middle" font-size="10" fill="#92400e">M</text>
-            <ellipse cx="200" cy="100" rx="80" ry="40" fill="none" stroke="#3b82f6" stroke-width="2" stroke-dasharray="5,5"/>
-            <text x="200" y="160" text-anchor="middle" font-size="12" fill="#374151">Gravitational Orbit</text>
-            <text x="200" y="175" text-anchor="middle" font-size="10" fill="#6b7280">F = GMm/r²</text>
-        </svg>""",
-        
-        7: """<svg viewBox="0 0 400 200" class="physics-diagram">
-            <rect x="50" y="80" width="300" height="40" fill="#3b82f6" opacity="0.3"/>
-            <line x1="200" y1="60" x2="200" y2="140" stroke="#ef4444" stroke-width="2" marker-end="url(#arrowhead)"/>
-            <text x="210" y="100" font-size="10" fill="#ef4444">P = ρgh</text>
-            <text x="200" y="160" text-anchor="middle" font-size="12" fill="#374151">Fluid Pressure</text>
-            <text x="200" y="175" text-anchor="middle" font-size="10" fill="#6b7280">Pressure increases with depth</text>
-        </svg>""",
-        
-        8: """<svg viewBox="0 0 400 200" class="physics-diagram">
-            <rect x="50" y="50" width="100" height="100" fill="#fbbf24" stroke="#f59e0b" stroke-width="2"/>
-            <text x="100" y="105" text-anchor="middle" font-size="12" fill="#92400e">Hot</text>
-            <rect x="250" y="50" width="100" height="100" fill="#3b82f6" stroke="#2563eb" stroke-width="2"/>
-            <text x="300" y="105" text-anchor="middle" font-size="12" fill="white">Cold</text>
-            <line x1="150" y1="100" x2="250" y2="100" stroke="#ef4444" stroke-width="3" marker-end="url(#arrowhead)"/>
-            <text x="200" y="90" font-size="12" fill="#ef4444">Heat Flow</text>
-            <text x="200" y="170" text-anchor="middle" font-size="12" fill="#374151">Thermodynamics</text>
-        </svg>"""
-    }
-    
-    return visualizations.get(int(chapter) if str(chapter).isdigit() else 1, visualizations[1])
+    svg = CHAPTER_VISUALIZATIONS.get(int(chapter) if str(chapter).isdigit() else 1, CHAPTER_VISUALIZATIONS[1])
+    return sprite_reference(svg, EXTRACTED_SHEET)
 
 def generate_tips_to_solve(chapter_info, problem_text):
     """Generate comprehensive tips for solving similar problems."""
@@ -313,6 +301,7 @@ def generate_tips_to_solve(chapter_info, problem_text):
     
     return tips_html
 
+@traced("render page")
 def generate_html_page(problem, chapter_info, problem_number):
     """Generate a complete HTML page for a physics problem."""
     title = chapter_info['title']
@@ -324,23 +313,7 @@ def generate_html_page(problem, chapter_info, problem_number):
   <meta charset="utf-8" />
   <meta name="viewport" content="width=device-width, initial-scale=1" />
   <title>Ch {chapter} Problem {problem_number} — {title}</title>
-  <style>
-    body {{ margin:0; font-family: ui-sans-serif, system-ui, -apple-system, Segoe UI, Roboto, Helvetica, Arial; background:#ffffff; color:#111827; line-height:1.55; }}
-    .container {{ max-width: 960px; margin:0 auto; padding:24px; }}
-    h1 {{ margin:0 0 8px; font-size:26px; color:#38bdf8; }}
-    h2 {{ margin:18px 0 8px; font-size:20px; color:#a78bfa; }}
-    h3 {{ margin:16px 0 6px; font-size:18px; color:#7c3aed; }}
-    .panel {{ background:#ffffff; border:1px solid #e5e7eb; border-radius:10px; padding:16px; margin:16px 0; }}
-    .q {{ border-left:3px solid #f59e0b; padding-left:10px; }}
-    .solution {{ border-left:3px solid #10b981; padding-left:10px; background:#f0fdf4; }}
-    .concept-section {{ background:#f8fafc; border:1px solid #e2e8f0; border-radius:8px; padding:12px; margin:12px 0; }}
-    .physics-diagram {{ max-width:100%; height:auto; display:block; margin:12px auto; border:1px solid #e5e7eb; border-radius:8px; background:#fafafa; }}
-    code {{ background:#f8fafc; border:1px solid #e5e7eb; padding:2px 6px; border-radius:6px; font-family: 'Courier New', monospace; }}
-    .muted {{ color:#374151; }}
-    ul {{ margin:8px 0 8px 20px; }}
-    li {{ margin:4px 0; }}
-    .formula {{ background:#fef3c7; border:1px solid #f59e0b; border-radius:6px; padding:8px; margin:8px 0; text-align:center; font-family: 'Courier New', monospace; }}
-  </style>
+  {PROBLEM_STYLESHEET}
 </head>
 <body>
   <div class="container">
@@ -373,7 +346,7 @@ def generate_html_page(problem, chapter_info, problem_number):
 
     <div class="panel">
       <h2>Source</h2>
-      <p class="muted">Extracted from: {problem['source']}</p>
+      <p class="muted">Extracted from: {problem['source']}, page {problem['page']}{f"; answer from {problem['answer_source']}" if problem.get('answer_source') else ''}</p>
     </div>
   </div>
 </body>
@@ -397,122 +370,116 @@ def get_key_formulas(chapter_info):
     title = chapter_info['title']
     return formulas.get(title, 'Physics formulas for this chapter')
 
-def process_pdf(pdf_path):
-    """Process a single PDF file and generate HTML pages."""
+def iter_pdf_problems(pdf_path, pages=None, answer_pdf=None, layout=False):
+    """Yield the problems of a single PDF file, or of its already streaming pages.
+
+    With answer_pdf, each problem found in its answer key gets that answer as its solution.
+    """
     pdf_name = os.path.basename(pdf_path)
     chapter_info = get_chapter_info(pdf_name)
+    answers = load_answer_key(answer_pdf) if answer_pdf else {}
     
     print(f"Processing {pdf_name}...")
     
-    text = extract_text_pymupdf(pdf_path)
-    if not text:
-        print(f"Could not extract text from {pdf_name}")
-        return []
-    
-    problems = extract_questions_and_solutions(text, pdf_name)
-    print(f"Found {len(problems)} problems in {pdf_name}")
-    
-    # Create output directory
-    chapter_dir = Path(f"Physics/ch{chapter_info['chapter']}")
-    chapter_dir.mkdir(parents=True, exist_ok=True)
-    
-    # Generate HTML pages
-    for i, problem in enumerate(problems, 1):
-        html_content = generate_html_page(problem, chapter_info, i)
-        output_file = chapter_dir / f"problem-{chapter_info['chapter']}-{i:02d}.html"
-        
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(html_content)
+    found = 0
+    try:
+        for problem in extract_questions_and_solutions(pages if pages is not None else iter_pages(pdf_path, layout=layout), pdf_name):
+            answer = answers.get((problem['chapter'] or chapter_info['chapter'], problem['exercise'], problem['number']))
+            if answer:
+                problem['solution'] = answer
+                problem['answer_source'] = os.path.basename(answer_pdf)
+            found += 1
+            yield problem
+    except Exception as e:
+        print(f"Could not extract text from {pdf_name}: {e}")
     
-    return problems
+    print(f"Found {found} problems in {pdf_name}")
 
-def main():
-    """Main function to process all Physics PDFs."""
-    physics_dir = Path("D:/repository/research/Physics")
-    
-    all_problems = []
-    
-    # Find all PDF files
-    pdf_files = list(physics_dir.rglob("*.pdf"))
-    print(f"Found {len(pdf_files)} PDF files")
-    
-    for pdf_path in pdf_files:
-        problems = process_pdf(pdf_path)
-        all_problems.extend(problems)
-    
-    # Create Physics index
-    create_physics_index(all_problems)
-    
-    print(f"Extraction complete! Generated HTML pages for {len(all_problems)} problems total.")
+def extract_problems(pdf_files, jobs=1, answer_pdf=None, layout=False):
+    """Yield the problems of the PDFs in order, parsing their pages on a process pool when jobs > 1."""
+    if jobs <= 1:
+        for pdf_path in pdf_files:
+            yield from iter_pdf_problems(pdf_path, answer_pdf=answer_pdf, layout=layout)
+        return
+    
+    # Every PDF is split into page slices queued up front, so one large book no
+    # longer holds back the run; scanning and writing stay here, in page order.
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        sources = [shard_pages(pdf_path, executor, jobs, layout=layout) for pdf_path in pdf_files]
+        for pdf_path, pages in zip(pdf_files, sources):
+            yield from iter_pdf_problems(pdf_path, pages, answer_pdf)
 
-def create_physics_index(problems):
-    """Create an index page for all physics problems."""
-    index_html = """<!DOCTYPE html>
-<html lang="en">
-<head>
-  <meta charset="utf-8" />
-  <meta name="viewport" content="width=device-width, initial-scale=1" />
-  <title>Physics · Questions Index</title>
-  <style>
-    body { font-family: ui-sans-serif, system-ui, -apple-system, Segoe UI, Roboto, Helvetica, Arial; margin: 24px; line-height: 1.55; }
-    h1 { color: #0ea5e9; margin: 0 0 12px; }
-    h2 { color: #7c3aed; margin: 24px 0 12px; }
-    .muted { color: #374151; }
-    ul { margin: 12px 0 0 20px; }
-    a { color: #2563eb; text-decoration: none; }
-    a:hover { text-decoration: underline; }
-    .source { font-size: 0.9em; color: #6b7280; margin-left: 8px; }
-  </style>
-</head>
-<body>
-  <h1>Physics · Questions Index</h1>
-  <p class="muted">Browse all extracted questions from Physics PDFs, organized by chapter.</p>
-"""
-    
-    # Group problems by chapter
-    by_chapter = {}
+def render_problems(problems):
+    """Number each chapter's problems; yield (output_file, html_content, index_record).
+
+    The record is (chapter, number, title, href), enough to list the page in
+    an index, so the problem itself can be dropped once its page is written.
+    """
+    numbers = {}
     for problem in problems:
-        chapter = problem['source'].replace('.pdf', '')
-        if chapter not in by_chapter:
-            by_chapter[chapter] = []
-        by_chapter[chapter].append(problem)
-    
-    # Add chapters
-    chapter_order = ['leph101', 'leph102', 'leph103', 'leph104', 'leph105', 'leph106', 'leph107', 'leph108']
-    chapter_names = {
-        'leph101': 'Physical World and Measurement',
-        'leph102': 'Kinematics', 
-        'leph103': 'Laws of Motion',
-        'leph104': 'Work, Energy and Power',
-        'leph105': 'Motion of System of Particles and Rigid Body',
-        'leph106': 'Gravitation',
-        'leph107': 'Properties of Bulk Matter',
-        'leph108': 'Thermodynamics'
-    }
-    
-    for chapter in chapter_order:
-        if chapter in by_chapter:
-            chapter_name = chapter_names.get(chapter, chapter)
-            chapter_num = chapter.replace('leph', '')
-            index_html += f"""
-  <h2>Chapter {chapter_num} - {chapter_name}</h2>
-  <ul>"""
-            
-            for i, problem in enumerate(by_chapter[chapter], 1):
-                problem_file = f"./ch{chapter_num}/problem-{chapter_num}-{i:02d}.html"
-                index_html += f"""
-    <li><a href="{problem_file}">Problem {chapter_num}.{i}: {problem['question'][:60]}...</a><span class="source">{chapter}.pdf</span></li>"""
-            
-            index_html += """
-  </ul>"""
-    
-    index_html += """
-  <p class="muted">Total: """ + str(len(problems)) + """ questions extracted from 10 PDF files</p>
-</body>
-</html>"""
-    
-    with open("Physics/index.html", 'w', encoding='utf-8') as f:
-        f.write(index_html)
+        chapter_info = get_chapter_info(problem['source'])
+        chapter = chapter_info['chapter']
+        number = numbers[chapter] = numbers.get(chapter, 0) + 1
+        href = f"ch{chapter}/problem-{chapter}-{number:02d}.html"
+        record = (problem['source'].replace('.pdf', ''), number, problem['question'][:60], href)
+        yield Path("Physics") / href, generate_html_page(problem, chapter_info, number), record
+
+def write_problem_pages(rendered):
+    """Write each rendered page; yield its index record once the page is written."""
+    records = deque()
+    def pages():
+        for output_file, html_content, record in rendered:
+            records.append(record)
+            yield output_file, html_content
+    for _ in write_pages(pages()):
+        yield records.popleft()
+
+def parse_args():
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description=__doc__.strip())
+    parser.add_argument('-j', '--jobs', type=int, default=1,
+                        help='number of processes parsing PDF pages (default: 1, 0 = one per CPU)')
+    parser.add_argument('-t', '--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help=f'skip questions at least this similar to one already written (default: {DEFAULT_THRESHOLD})')
+    parser.add_argument('--layout', action='store_true',
+                        help='read pages in layout order (columns, margin notes) instead of as flat text')
+    parser.add_argument('--trace', metavar='FILE',
+                        help='write a Chrome trace of the run to FILE and print a timing summary')
+    args = parser.parse_args()
+    if args.trace:
+        enable(args.trace)
+    if args.jobs == 0:
+        args.jobs = os.cpu_count() or 1
+    return args
+
+def main():
+    """Main function to process all Physics PDFs."""
+    args = parse_args()
+    try:
+        write_stylesheet()
+        write_sprite_sheet(CHAPTER_VISUALIZATIONS.values(), EXTRACTED_SHEET)
+        physics_dir = Path("D:/repository/research/Physics")
+    
+        # Find all PDF files (sorted so serial and parallel runs see the same order)
+        pdf_files = sorted(physics_dir.rglob("*.pdf"))
+        print(f"Found {len(pdf_files)} PDF files")
+    
+        # The answers PDF is not a chapter: it is indexed and its answers become the solutions
+        answer_pdf = next((pdf for pdf in pdf_files if pdf.name in ANSWER_PDFS), None)
+        pdf_files = [pdf for pdf in pdf_files if pdf.name not in ANSWER_PDFS]
+    
+        # extract -> dedupe -> render -> write, one problem at a time
+        problems = extract_problems(pdf_files, args.jobs, answer_pdf, args.layout)
+        problems = iter_unique(problems, lambda problem: problem['question'], args.threshold)
+        total = sum(1 for _ in write_problem_pages(render_problems(problems)))
+    
+        # Only the chapters whose pages changed are indexed again
+        pages, rendered = write_site_indexes(['physics'])['physics']
+        print(f"Physics index: {pages} problems, {rendered} chapters rendered")
+    
+        print(f"Extraction complete! Generated HTML pages for {total} problems total.")
+    finally:
+        finish_trace()  # no-op unless --trace was given
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,164 @@
+"""
+Lightweight spans and counters for the build and extraction scripts.
+
+Tracing is off unless the BUILD_TRACE environment variable names a trace file
+(the scripts' --trace option sets it). While it is off, span() and count()
+return straight away. While it is on, every process, including the workers
+of a process pool, which inherit the variable, buffers its events and appends
+them to its own part file beside the trace when it exits. finish_trace() then
+merges the parts into one Chrome trace-event JSON file, which can be opened
+in chrome://tracing or Perfetto, and prints a per-span summary table.
+"""
+
+import atexit
+import functools
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from multiprocessing import util
+from pathlib import Path
+
+TRACE_ENV = "BUILD_TRACE"
+
+_enabled = TRACE_ENV in os.environ  # pool workers inherit the variable, so this holds in them too
+_lock = threading.Lock()
+_buffer = {'pid': None, 'events': []}
+
+def trace_path():
+    """Return the trace file named by BUILD_TRACE, or None when tracing is off."""
+    path = os.environ.get(TRACE_ENV)
+    return Path(path) if path else None
+
+def enable(path):
+    """Turn tracing on for this process and the workers it starts."""
+    global _enabled
+    os.environ[TRACE_ENV] = str(Path(path).resolve())
+    _enabled = True
+    parts_dir(trace_path()).mkdir(parents=True, exist_ok=True)
+
+def parts_dir(path):
+    """Directory holding each process's events until finish_trace() merges them."""
+    return path.with_name(path.name + ".parts")
+
+def _now():
+    """Microseconds on a clock shared by every process of the run."""
+    return time.perf_counter_ns() // 1000
+
+def _record(event):
+    """Buffer an event for the current process."""
+    pid = os.getpid()
+    with _lock:
+        if _buffer['pid'] != pid:
+            # First event here, or a forked child holding a copy of its parent's buffer.
+            _buffer['pid'] = pid
+            _buffer['events'] = []
+            atexit.register(flush)
+            util.Finalize(None, flush, exitpriority=0)  # pool workers exit without running atexit
+        event['pid'] = pid
+        event['tid'] = threading.get_native_id()
+        _buffer['events'].append(event)
+
+def flush():
+    """Append this process's buffered events to its part file."""
+    path = trace_path()
+    with _lock:
+        events = _buffer['events'] if _buffer['pid'] == os.getpid() else []
+        _buffer['events'] = []
+    if not events or path is None:
+        return
+    directory = parts_dir(path)
+    directory.mkdir(parents=True, exist_ok=True)
+    with open(directory / f"{os.getpid()}.jsonl", 'a', encoding='utf-8') as f:
+        for event in events:
+            f.write(json.dumps(event) + "\n")
+
+@contextmanager
+def span(name, **args):
+    """Time the enclosed block as a complete ('X') event called name."""
+    if not _enabled:
+        yield
+        return
+    start = _now()
+    try:
+        yield
+    finally:
+        _record({'name': name, 'ph': 'X', 'ts': start, 'dur': _now() - start, 'args': args})
+
+def traced(name):
+    """Decorator: run every call of the function inside span(name)."""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return func(*args, **kwargs)
+            with span(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+def count(name, value=1):
+    """Add value to the counter called name."""
+    if not _enabled:
+        return
+    _record({'name': name, 'ph': 'C', 'ts': _now(), 'args': {'value': value}})
+
+def read_parts(path):
+    """Return every event the processes of the run have written, and remove their part files."""
+    events = []
+    directory = parts_dir(path)
+    for part in sorted(directory.glob("*.jsonl")):
+        with open(part, encoding='utf-8') as f:
+            events.extend(json.loads(line) for line in f)
+        part.unlink()
+    if directory.exists():
+        directory.rmdir()
+    return events
+
+def summarize(events):
+    """Return ({span: (count, total us, max us)}, {counter: total}) for a list of events."""
+    spans = {}
+    counters = {}
+    for event in events:
+        if event['ph'] == 'X':
+            calls, total, longest = spans.get(event['name'], (0, 0, 0))
+            spans[event['name']] = (calls + 1, total + event['dur'], max(longest, event['dur']))
+        elif event['ph'] == 'C':
+            counters[event['name']] = counters.get(event['name'], 0) + event['args']['value']
+    return spans, counters
+
+def to_chrome_trace(events):
+    """Convert events to Chrome trace-event format, with per-process running totals for the counters."""
+    events = sorted(events, key=lambda event: event['ts'])
+    start = events[0]['ts'] if events else 0
+    totals = {}
+    trace_events = []
+    for event in events:
+        event = dict(event, ts=event['ts'] - start)
+        if event['ph'] == 'C':
+            key = (event['pid'], event['name'])
+            totals[key] = totals.get(key, 0) + event['args']['value']
+            event['args'] = {'value': totals[key]}
+        trace_events.append(event)
+    return {'traceEvents': trace_events, 'displayTimeUnit': 'ms'}
+
+def finish_trace():
+    """Merge the run's events into the trace file and print the summary; no-op when tracing is off."""
+    path = trace_path()
+    if path is None:
+        return
+    flush()
+    events = read_parts(path)
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(to_chrome_trace(events), f)
+    os.replace(tmp_path, path)
+
+    spans, counters = summarize(events)
+    print(f"{'span':<28}{'calls':>8}{'total':>12}{'mean':>12}{'max':>12}")
+    for name, (calls, total, longest) in sorted(spans.items(), key=lambda item: -item[1][1]):
+        print(f"{name:<28}{calls:>8}{total / 1000:>10.1f}ms{total / calls / 1000:>10.2f}ms{longest / 1000:>10.2f}ms")
+    for name, total in sorted(counters.items()):
+        print(f"{name:<28}{total:>8}")
+    print(f"Trace with {len(events)} events written to {path}")
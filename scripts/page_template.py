@@ -0,0 +1,143 @@
+"""
+Compiled page templates shared by the problem generators.
+
+A template is plain text with {name} placeholders and optional sections,
+{?name}...{/name}, that are only rendered when the field is truthy; {{ and }}
+stand for literal braces. compile_template() turns a template into a Python
+function built around a single f-string and caches it by the template's hash,
+so each layout is compiled once per process.
+"""
+
+import hashlib
+import re
+from instrument import traced
+from site_assets import PROBLEM_STYLESHEET
+
+TOKEN_RE = re.compile(r'\{\{|\}\}|\{([?/]?)(\w+)\}')
+
+_compiled = {}   # template hash -> render function
+_by_source = {}  # template text -> render function; str hashes are cached, so this is cheap
+
+PROBLEM_PAGE = """<!DOCTYPE html>
+<html lang="en">
+<head>
+  <meta charset="utf-8" />
+  <meta name="viewport" content="width=device-width, initial-scale=1" />
+  <title>Ch {chapter} Problem {problem_num} — {title}</title>
+  {stylesheet}
+</head>
+<body>
+  <div class="container">
+    <h1>Chapter {chapter} · Problem {problem_num}</h1>
+    <div class="panel q">
+      <h2>Question</h2>
+      <p>{question}</p>
+    </div>
+
+    <div class="concept-section">
+      <h2>Background Concept — {title}</h2>
+      {background}
+    </div>
+{?visualization_svg}
+    <div class="panel">
+      <h2>Visualization</h2>
+      {visualization_svg}
+    </div>
+{/visualization_svg}
+    <div class="panel solution">
+      <h2>Solution</h2>
+      <p>{solution}</p>
+    </div>
+
+    <div class="panel">
+      <h2>Tips to Solve</h2>
+      <ul>
+        {tips}
+      </ul>
+    </div>
+
+    <div class="panel">
+      <h2>Key Formulas</h2>
+      <div class="formula">
+        {formulas}
+      </div>
+    </div>
+
+    <div class="panel">
+      <h2>Source</h2>
+      <p class="muted">{source_note}</p>
+    </div>
+  </div>
+</body>
+</html>"""
+
+def template_hash(source):
+    """Return the cache key of a template."""
+    return hashlib.sha256(source.encode('utf-8')).hexdigest()
+
+def _literal(text):
+    """Escape text for use inside a single-quoted f-string."""
+    for old, new in (('\\', '\\\\'), ("'", "\\'"), ('\n', '\\n'), ('\r', '\\r'), ('{', '{{'), ('}', '}}')):
+        text = text.replace(old, new)
+    return text
+
+def generate_code(source):
+    """Translate a template into the source of a render(**fields) function.
+
+    The page becomes one f-string; each optional section becomes a local
+    f-string, evaluated before it and substituted in when its field is set.
+    """
+    names = []
+    sections = []
+    stack = [(None, [])]
+    position = 0
+    for token in TOKEN_RE.finditer(source):
+        stack[-1][1].append(_literal(source[position:token.start()]))
+        position = token.end()
+        kind, name = token.groups()
+        if name is None:
+            stack[-1][1].append(_literal(token.group(0)[0]))
+            continue
+        if name not in names:
+            names.append(name)
+        if kind == '?':
+            stack.append((name, []))
+        elif kind == '/':
+            section, parts = stack.pop()
+            if section != name or not stack:
+                raise ValueError(f"Unbalanced section {{/{name}}} at offset {token.start()}")
+            local = f"_section{len(sections)}"
+            sections.append(f"    {local} = f'{''.join(parts)}' if {name} else ''\n")
+            stack[-1][1].append(f"{{{local}}}")
+        else:
+            stack[-1][1].append(f"{{{name}}}")
+    stack[-1][1].append(_literal(source[position:]))
+
+    if len(stack) != 1:
+        raise ValueError(f"Unclosed section {{?{stack[-1][0]}}}")
+    signature = ", ".join(names)
+    return f"def render(*, {signature}):\n{''.join(sections)}    return f'{''.join(stack[0][1])}'\n"
+
+def compile_template(source):
+    """Return the render(**fields) function for a template, compiling it on first use."""
+    render = _by_source.get(source)
+    if render is not None:
+        return render
+    key = template_hash(source)
+    render = _compiled.get(key)
+    if render is None:
+        namespace = {}
+        exec(compile(generate_code(source), f"<template {key[:10]}>", 'exec'), namespace)
+        render = _compiled[key] = namespace['render']
+    _by_source[source] = render
+    return render
+
+@traced("render page")
+def render_problem_page(chapter, problem_num, title, question, background, solution, tips, formulas,
+                        visualization_svg=None, source_note=None):
+    """Render a problem page; the visualization panel is left out when there is no diagram."""
+    return compile_template(PROBLEM_PAGE)(
+        stylesheet=PROBLEM_STYLESHEET, chapter=chapter, problem_num=problem_num, title=title,
+        question=question, background=background, visualization_svg=visualization_svg,
+        solution=solution, tips=tips, formulas=formulas,
+        source_note=source_note or f"Expected 12th Board 2026 - Chapter {chapter}")
@@ -0,0 +1,103 @@
+"""
+Write generated pages only when their content changes.
+
+write_page() compares the new content's hash with the file already on disk and
+leaves unchanged files alone, so their mtimes stay put and git and the Pages
+deploy see no churn. Changed files are written to a temporary file and renamed
+into place, so a page is never left half-written.
+
+render_pages() and write_pages() spread a batch of pages over a process pool
+for rendering and a bounded thread pool for writing, while still yielding
+results in input order so logs read the same on every run.
+"""
+
+import hashlib
+import os
+import threading
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+from instrument import count, traced
+
+# Writes are I/O bound, so a few threads suffice; more only contend for the disk.
+IO_THREADS = 4
+
+write_counts = {'written': 0, 'skipped': 0}
+_counts_lock = threading.Lock()
+
+def page_bytes(content):
+    """Encode page text exactly as open(path, 'w', encoding='utf-8') would write it."""
+    if os.linesep != "\n":
+        content = content.replace("\n", os.linesep)
+    return content.encode('utf-8')
+
+def file_digest(path):
+    """Return the SHA-256 digest of a file, or None if it does not exist."""
+    try:
+        with open(path, 'rb') as f:
+            return hashlib.sha256(f.read()).digest()
+    except FileNotFoundError:
+        return None
+
+def write_page(path, content):
+    """Write content to path unless the file already holds it; return True if written."""
+    return write_bytes(path, page_bytes(content))
+
+@traced("write file")
+def write_bytes(path, data):
+    """Write raw bytes to path unless the file already holds them; return True if written."""
+    path = Path(path)
+    if file_digest(path) == hashlib.sha256(data).digest():
+        with _counts_lock:
+            write_counts['skipped'] += 1
+        count("files unchanged")
+        return False
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    finally:
+        if tmp_path.exists():
+            tmp_path.unlink()
+    with _counts_lock:
+        write_counts['written'] += 1
+    count("files written")
+    count("bytes written", len(data))
+    return True
+
+def render_pages(render, items, jobs=1):
+    """Yield render(item) for each item, in order, using jobs worker processes (0 means one per CPU).
+
+    render must be a module-level function so that it can be sent to the workers.
+    """
+    items = list(items)
+    jobs = jobs or os.cpu_count() or 1
+    if jobs == 1 or len(items) < 2:
+        yield from map(render, items)
+        return
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        yield from pool.map(render, items, chunksize=max(1, len(items) // (jobs * 4)))
+
+def write_pages(pages, io_threads=IO_THREADS):
+    """Write (path, content) pairs with write_page() on a thread pool; yield (path, written) in input order.
+
+    At most 2 * io_threads writes are in flight, so rendered pages do not pile
+    up in memory when the disk is slower than the renderers.
+    """
+    with ThreadPoolExecutor(max_workers=io_threads) as pool:
+        in_flight = deque()
+        for path, content in pages:
+            in_flight.append((path, pool.submit(write_page, path, content)))
+            if len(in_flight) >= 2 * io_threads:
+                done_path, future = in_flight.popleft()
+                yield done_path, future.result()
+        while in_flight:
+            done_path, future = in_flight.popleft()
+            yield done_path, future.result()
+
+def print_write_summary():
+    """Report how many files were written and how many were already up to date."""
+    print(f"{write_counts['written']} files written, {write_counts['skipped']} unchanged")
@@ -0,0 +1,83 @@
+"""
+Layout-aware page text: reading order for two-column pages, margin notes and inline maths.
+
+page_layout() reads a page with get_text("dict") and keeps only what reading
+order needs: the page width and, for each text block, its bounding box and its
+lines. Lines that share a baseline band, such as superscripts and the pieces of
+an inline formula, are merged left to right. The result is small and plain
+JSON, so pdf_text caches it once per PDF revision. reading_order() rebuilds
+the text from it on every read. Blocks that span the centre of the page cut it
+into bands. A band with column-wide text on both sides of the centre is read
+left column first, other bands row by row, and margin notes come last.
+"""
+
+import fitz  # PyMuPDF
+
+LAYOUT_VERSION = 1
+
+# Blocks narrower than this fraction of the page, inside its outer edge, are margin notes.
+MARGIN_FRACTION = 0.12
+# A block at least this fraction of the page wide, on one side of the centre, is column text.
+COLUMN_FRACTION = 0.3
+# How far, as a fraction of the page width, a block must reach past the centre to span it.
+CENTRE_TOLERANCE = 0.02
+
+def merge_rows(lines):
+    """Merge (x0, y0, x1, y1, text) lines whose vertical centres fall in one band; return row texts."""
+    rows = []  # [y0, y1, [(x0, text)]]
+    for x0, y0, x1, y1, text in sorted(lines, key=lambda line: (line[1], line[0])):
+        centre = (y0 + y1) / 2
+        for row in rows:
+            if row[0] <= centre <= row[1]:
+                row[0], row[1] = min(row[0], y0), max(row[1], y1)
+                row[2].append((x0, text))
+                break
+        else:
+            rows.append([y0, y1, [(x0, text)]])
+    return [" ".join(text for _, text in sorted(pieces)) for _, _, pieces in rows]
+
+def page_layout(page):
+    """Return the compact layout of a PyMuPDF page: {'width': w, 'blocks': [[x0, y0, x1, y1, text]]}."""
+    # TEXTFLAGS_TEXT leaves images out; decoding them would cost far more than the text.
+    data = page.get_text("dict", flags=fitz.TEXTFLAGS_TEXT)
+    blocks = []
+    for block in data['blocks']:
+        if block.get('type') != 0:
+            continue  # images
+        lines = []
+        for line in block['lines']:
+            text = "".join(span['text'] for span in line['spans']).strip()
+            if text:
+                lines.append((*line['bbox'], text))
+        if lines:
+            x0, y0, x1, y1 = block['bbox']
+            blocks.append([round(x0, 1), round(y0, 1), round(x1, 1), round(y1, 1), "\n".join(merge_rows(lines))])
+    return {'width': round(data['width'], 1), 'blocks': blocks}
+
+def read_band(band, width):
+    """Order the blocks of one band: by column when it has column text on both sides, else by row."""
+    centre = width / 2
+    column_width = COLUMN_FRACTION * width
+    left = [block for block in band if (block[0] + block[2]) / 2 < centre]
+    right = [block for block in band if (block[0] + block[2]) / 2 >= centre]
+    if any(x1 - x0 >= column_width for x0, _, x1, _, _ in left) and \
+            any(x1 - x0 >= column_width for x0, _, x1, _, _ in right):
+        return sorted(left, key=lambda block: block[1]) + sorted(right, key=lambda block: block[1])
+    return sorted(band, key=lambda block: (block[1], block[0]))
+
+def reading_order(layout):
+    """Rebuild a page's text from its layout in reading order."""
+    width = layout['width']
+    centre, tolerance, margin = width / 2, CENTRE_TOLERANCE * width, MARGIN_FRACTION * width
+    ordered, band, notes = [], [], []
+    for block in sorted(layout['blocks'], key=lambda block: (block[1], block[0])):
+        x0, _, x1, _, _ = block
+        if x1 - x0 < margin and (x1 <= margin or x0 >= width - margin):
+            notes.append(block)
+        elif x0 < centre - tolerance and x1 > centre + tolerance:
+            ordered += read_band(band, width) + [block]
+            band = []
+        else:
+            band.append(block)
+    ordered += read_band(band, width) + notes
+    return "\n".join(block[4] for block in ordered)
@@ -0,0 +1,227 @@
+"""
+Cached PDF text extraction shared by the extraction scripts.
+
+Page text is stored under .cache/pdf_text as gzip-compressed JSONL, keyed by the
+SHA-256 of the PDF and EXTRACTOR_VERSION, so unchanged textbooks are never
+re-parsed with PyMuPDF. Pages are streamed one at a time, whether they come
+from the cache or from the PDF itself. In layout mode the cache holds each
+page's block geometry instead (see pdf_layout), keyed by LAYOUT_VERSION, and
+the text is rebuilt from it in reading order.
+
+A single PDF can also be parsed on a process pool: shard_pages() hands each
+worker a contiguous slice of pages, which it extracts from its own copy of the
+document, and streams the slices back in page order, so the chunking in
+iter_page_chunks() stitches questions across slice boundaries exactly as it
+does across page breaks.
+"""
+
+import bisect
+import gzip
+import hashlib
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+import fitz  # PyMuPDF
+from instrument import count, span
+from pdf_layout import LAYOUT_VERSION, page_layout, reading_order
+
+# Fewest pages handed to a worker at once; each slice reopens the document.
+MIN_SLICE_PAGES = 4
+
+# Bump whenever page text extraction changes so stale cache entries are ignored.
+EXTRACTOR_VERSION = 1
+
+CACHE_DIR = Path(os.environ.get("PDF_TEXT_CACHE", ".cache/pdf_text"))
+
+def file_hash(pdf_path):
+    """Return the SHA-256 hex digest of a file's contents."""
+    digest = hashlib.sha256()
+    with open(pdf_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def cache_path(pdf_path, layout=False):
+    """Get the cache file used for a PDF's page text, or with layout for its page layouts."""
+    version = f"layout-v{LAYOUT_VERSION}" if layout else f"v{EXTRACTOR_VERSION}"
+    return CACHE_DIR / f"{file_hash(pdf_path)}-{version}.jsonl.gz"
+
+def extract_page(doc, page_num, source, layout=False):
+    """Extract one page (numbered from 0) of an open document: its text, or with layout its layout."""
+    with span("parse page", source=source):
+        page = doc[page_num]
+        content = page_layout(page) if layout else page.get_text()
+    count("pages parsed")
+    return content
+
+def as_text(pages, layout):
+    """Turn streamed (page_number, content) pairs into (page_number, text) pairs."""
+    if not layout:
+        return pages
+    return ((page_num, reading_order(content)) for page_num, content in pages)
+
+def iter_pdf_content(pdf_path, layout=False):
+    """Yield (page_number, content) for each page with PyMuPDF, bypassing the cache."""
+    doc = fitz.open(pdf_path)
+    try:
+        for page_num in range(doc.page_count):
+            yield page_num + 1, extract_page(doc, page_num, os.path.basename(pdf_path), layout)
+    finally:
+        doc.close()
+
+def iter_pdf_pages(pdf_path, layout=False):
+    """Yield (page_number, text) for each page with PyMuPDF, bypassing the cache."""
+    return as_text(iter_pdf_content(pdf_path, layout), layout)
+
+def page_slices(page_count, jobs):
+    """Split pages 0..page_count-1 into contiguous (start, stop) ranges, about one per job."""
+    size = max(MIN_SLICE_PAGES, -(-page_count // jobs))
+    return [(start, min(start + size, page_count)) for start in range(0, page_count, size)]
+
+def read_page_slice(task):
+    """Open the PDF independently and return [(page_number, content)] for one slice of its pages."""
+    pdf_path, start, stop, layout = task
+    doc = fitz.open(pdf_path)
+    try:
+        return [(page_num + 1, extract_page(doc, page_num, os.path.basename(pdf_path), layout))
+                for page_num in range(start, stop)]
+    finally:
+        doc.close()
+
+def submit_page_slices(pool, pdf_path, jobs, layout=False):
+    """Queue the page slices of a PDF on pool; return their futures in page order."""
+    doc = fitz.open(pdf_path)
+    try:
+        page_count = doc.page_count
+    finally:
+        doc.close()
+    return [pool.submit(read_page_slice, (pdf_path, start, stop, layout))
+            for start, stop in page_slices(page_count, jobs)]
+
+def iter_slice_results(futures):
+    """Yield the pages of each slice as it completes, in page order."""
+    for future in futures:
+        yield from future.result()
+
+def read_cache_header(path, version=EXTRACTOR_VERSION):
+    """Return the header of a cache file, or None if it is missing or unusable."""
+    if not path.exists():
+        return None
+    try:
+        with gzip.open(path, 'rt', encoding='utf-8') as f:
+            header = json.loads(f.readline())
+    except (OSError, ValueError) as e:
+        print(f"Ignoring unreadable cache {path}: {e}")
+        return None
+    if header.get('version') != version:
+        return None
+    return header
+
+def iter_cached_content(path, field='text'):
+    """Yield (page_number, content) from a cache file."""
+    with gzip.open(path, 'rt', encoding='utf-8') as f:
+        f.readline()  # header
+        for line in f:
+            record = json.loads(line)
+            count("pages from cache")
+            yield record['page'], record[field]
+
+def iter_write_through(pdf_path, path, pages, layout=False):
+    """Yield streamed (page_number, content) pages while writing them to the cache.
+
+    The cache entry only appears, via rename, once every page has been written.
+    """
+    field, version = ('layout', LAYOUT_VERSION) if layout else ('text', EXTRACTOR_VERSION)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    complete = False
+    try:
+        with gzip.open(tmp_path, 'wt', encoding='utf-8') as f:
+            f.write(json.dumps({'source': os.path.basename(pdf_path), 'version': version}) + "\n")
+            for page_num, content in pages:
+                f.write(json.dumps({'page': page_num, field: content}, ensure_ascii=False,
+                                   separators=(',', ':')) + "\n")
+                yield page_num, content
+        complete = True
+        os.replace(tmp_path, path)
+    finally:
+        if not complete and tmp_path.exists():
+            tmp_path.unlink()
+
+def iter_cached_or_parsed(pdf_path, parse, layout=False):
+    """Return the PDF's cached content, or else call parse() and write its stream through to the cache."""
+    field, version = ('layout', LAYOUT_VERSION) if layout else ('text', EXTRACTOR_VERSION)
+    path = cache_path(pdf_path, layout)
+    if read_cache_header(path, version) is not None:
+        return iter_cached_content(path, field)
+    return iter_write_through(pdf_path, path, parse(), layout)
+
+def shard_pages(pdf_path, pool, jobs, use_cache=True, layout=False):
+    """Start parsing a PDF on pool in page slices; return an iterator over its (page_number, text) pages in order.
+
+    The slices are queued before this returns, so several PDFs can be sharded
+    onto one pool up front and the workers never wait for a book to finish.
+    A cached PDF is streamed from the cache without touching the pool.
+    """
+    def parse():
+        return iter_slice_results(submit_page_slices(pool, pdf_path, jobs, layout))
+
+    pages = iter_cached_or_parsed(pdf_path, parse, layout) if use_cache else parse()
+    return as_text(pages, layout)
+
+def iter_pages(pdf_path, use_cache=True, jobs=1, layout=False):
+    """Yield (page_number, text) for each page, streaming from the cache when the PDF is unchanged.
+
+    With jobs > 1 an uncached PDF is parsed on that many worker processes. With
+    layout, the text follows reading order rebuilt from the cached page layouts.
+    """
+    if jobs > 1:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            yield from shard_pages(pdf_path, pool, jobs, use_cache, layout)
+        return
+    if not use_cache:
+        yield from iter_pdf_pages(pdf_path, layout)
+        return
+    pages = iter_cached_or_parsed(pdf_path, lambda: iter_pdf_content(pdf_path, layout), layout)
+    yield from as_text(pages, layout)
+
+def read_page_texts(pdf_path, use_cache=True):
+    """Return the text of every page as a list."""
+    return [text for _, text in iter_pages(pdf_path, use_cache)]
+
+def iter_page_chunks(pages, boundary_re):
+    """Regroup streamed pages into chunks that never end inside a question.
+
+    Text from the last boundary_re match on a page onwards is carried into the
+    next chunk, so a question that starts near the bottom of one page is scanned
+    together with its continuation. Each page contributes its text plus a newline,
+    exactly as in the whole-document text. Yields (chunk_text, page_starts), where
+    page_starts is a sorted list of (offset, page_number) pairs for page_at().
+    """
+    carry = ""
+    carry_starts = []
+    for page_num, text in pages:
+        chunk = carry + text + "\n"
+        page_starts = carry_starts + [(len(carry), page_num)]
+
+        cut = 0
+        for match in boundary_re.finditer(chunk):
+            cut = match.start()
+        if cut == 0:
+            # No boundary after the start of the chunk: keep accumulating.
+            carry, carry_starts = chunk, page_starts
+            continue
+
+        yield chunk[:cut], page_starts
+        carry = chunk[cut:]
+        carry_starts = [(0, page_at(page_starts, cut))]
+        carry_starts += [(offset - cut, num) for offset, num in page_starts if offset > cut]
+
+    if carry:
+        yield carry, carry_starts
+
+def page_at(page_starts, offset):
+    """Return the page number containing offset within a chunk from iter_page_chunks()."""
+    index = bisect.bisect_right([start for start, _ in page_starts], offset) - 1
+    return page_starts[max(index, 0)][1]
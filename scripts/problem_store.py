@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Unified problem store shared by the generator scripts.
+
+Problems live in data/problems/<subject>.jsonl, one JSON record per line with
+id, subject, chapter, chapter_title, num, generator (the script that renders
+it), title, question, background, solution, tips, formulas and an optional svg.
+The JSONL files are indexed into an SQLite database under .cache, rebuilt
+whenever they change, so callers load only the problems they ask for.
+"""
+
+import argparse
+import json
+import os
+import sqlite3
+from pathlib import Path
+
+DATA_DIR = Path(os.environ.get("PROBLEM_DATA_DIR", "data/problems"))
+INDEX_PATH = Path(os.environ.get("PROBLEM_INDEX", ".cache/problems.sqlite"))
+
+# Generators whose pages have since been edited by hand; rebuilding them would
+# revert those edits, so they are only rendered on request (--all).
+HAND_EDITED_GENERATORS = {"restore_all_chemistry_problems"}
+
+SCHEMA = """
+CREATE TABLE problems (
+    id TEXT PRIMARY KEY,
+    subject TEXT NOT NULL,
+    chapter INTEGER NOT NULL,
+    num INTEGER NOT NULL,
+    generator TEXT NOT NULL,
+    record TEXT NOT NULL
+);
+CREATE INDEX problems_by_chapter ON problems (subject, chapter, num);
+CREATE INDEX problems_by_generator ON problems (generator, chapter, num);
+CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+"""
+
+_connection = None
+_connection_pid = None
+
+def source_files():
+    """Return the JSONL source files, sorted by subject."""
+    return sorted(DATA_DIR.glob("*.jsonl"))
+
+def source_signature():
+    """Summarise the sources' sizes and mtimes to detect changes cheaply."""
+    return json.dumps([(path.name, path.stat().st_size, path.stat().st_mtime_ns) for path in source_files()])
+
+def build_index():
+    """Rebuild the SQLite index from the JSONL sources."""
+    INDEX_PATH.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = INDEX_PATH.with_name(f"{INDEX_PATH.name}.{os.getpid()}.tmp")
+    if tmp_path.exists():
+        tmp_path.unlink()
+
+    conn = sqlite3.connect(tmp_path)
+    conn.executescript(SCHEMA)
+    for path in source_files():
+        with open(path, encoding='utf-8') as f:
+            for line_num, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                    row = (record['id'], record['subject'], record['chapter'], record['num'],
+                           record['generator'], line)
+                    conn.execute("INSERT INTO problems VALUES (?, ?, ?, ?, ?, ?)", row)
+                except (ValueError, KeyError, sqlite3.IntegrityError) as e:
+                    conn.close()
+                    tmp_path.unlink()
+                    raise ValueError(f"{path}:{line_num}: invalid problem record: {e}")
+    conn.execute("INSERT INTO meta VALUES ('signature', ?)", (source_signature(),))
+    conn.commit()
+    conn.close()
+    os.replace(tmp_path, INDEX_PATH)
+
+def connect():
+    """Return a connection to the index, rebuilding it if the sources changed."""
+    global _connection, _connection_pid
+    # SQLite connections must not be shared with forked worker processes
+    if _connection is not None and _connection_pid == os.getpid():
+        return _connection
+    _connection_pid = os.getpid()
+
+    signature = source_signature()
+    if INDEX_PATH.exists():
+        conn = sqlite3.connect(INDEX_PATH)
+        try:
+            row = conn.execute("SELECT value FROM meta WHERE key = 'signature'").fetchone()
+        except sqlite3.DatabaseError:
+            row = None
+        if row and row[0] == signature:
+            _connection = conn
+            return conn
+        conn.close()
+
+    print(f"Indexing problems from {DATA_DIR}...")
+    build_index()
+    _connection = sqlite3.connect(INDEX_PATH)
+    return _connection
+
+def _query(where, params):
+    """Yield decoded records matching a WHERE clause, in chapter order."""
+    cursor = connect().execute(
+        f"SELECT record FROM problems WHERE {where} ORDER BY subject, chapter, num", params)
+    for (record,) in cursor:
+        yield json.loads(record)
+
+def iter_problems(subject=None, chapter=None, generator=None):
+    """Lazily yield problems, optionally filtered by subject, chapter and generator."""
+    clauses, params = [], []
+    for column, value in (('subject', subject), ('chapter', chapter), ('generator', generator)):
+        if value is not None:
+            clauses.append(f"{column} = ?")
+            params.append(value)
+    return _query(" AND ".join(clauses) or "1", params)
+
+def get_problem(problem_id):
+    """Return a single problem by id, e.g. 'physics-3-01'."""
+    for record in _query("id = ?", (problem_id,)):
+        return record
+    raise KeyError(problem_id)
+
+def get_chapter(subject, chapter, generator=None):
+    """Return a chapter as {'title': ..., 'problems': [...]}, the shape the generators iterate over."""
+    problems = list(iter_problems(subject, chapter, generator))
+    if not problems:
+        raise KeyError(f"{subject} chapter {chapter}")
+    return {'title': problems[0]['chapter_title'], 'problems': problems}
+
+def generator_chapters(generator):
+    """Return the sorted (subject, chapter) pairs a generator script renders."""
+    cursor = connect().execute(
+        "SELECT DISTINCT subject, chapter FROM problems WHERE generator = ? ORDER BY subject, chapter",
+        (generator,))
+    return cursor.fetchall()
+
+def main():
+    """List problems in the store."""
+    parser = argparse.ArgumentParser(description="List problems in the problem store.")
+    parser.add_argument('subject', nargs='?', help='physics, maths or chemistry')
+    parser.add_argument('chapter', nargs='?', type=int, help='chapter number')
+    parser.add_argument('--generator', help='only problems rendered by this generator script')
+    parser.add_argument('--rebuild', action='store_true', help='rebuild the index first')
+    args = parser.parse_args()
+
+    if args.rebuild:
+        build_index()
+
+    count = 0
+    for problem in iter_problems(args.subject, args.chapter, args.generator):
+        print(f"{problem['id']:<16}{problem['generator']:<36}{problem['title']}")
+        count += 1
+    print(f"{count} problems")
+
+if __name__ == "__main__":
+    main()
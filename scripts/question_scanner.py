@@ -0,0 +1,86 @@
+"""
+Single-pass question scanner shared by the extraction scripts.
+
+BOUNDARY_RE tokenizes the text once into question boundaries: numbered exercise
+questions ("1." / "1)"), "Problem N.N", "Example N" and "QN" markers. Question
+and solution spans are then cut out between consecutive boundaries instead of
+running one backtracking regex per question style over the whole text.
+"""
+
+import re
+
+# Group names double as the rule a match is tagged with; alternatives are tried
+# in order, so each line yields at most one boundary.
+_BOUNDARY_RULES = r'''
+    (?P<problem>Problem\s+\d+\.\d+[:\s]\s*)
+  | (?P<example>Example\s+\d+[:\s]\s*)
+  | (?P<q>Q\d+[\.\)]\s+)
+  | (?P<exercise>(?:Exercise\s+)?\d+[\.\)]\s+)
+'''
+
+BOUNDARY_RE = re.compile(r'^[ \t]*(?:' + _BOUNDARY_RULES + r')', re.MULTILINE | re.IGNORECASE | re.VERBOSE)
+
+# Also treats any line starting with a letter as a possible bare question
+# ("What is ...?"). Used when only question text is wanted, not solutions.
+DIRECT_BOUNDARY_RE = re.compile(
+    r'^[ \t]*(?:' + _BOUNDARY_RULES + r'| (?P<direct>(?=[A-Z])))',
+    re.MULTILINE | re.IGNORECASE | re.VERBOSE)
+
+# The question itself: the rest of the line up to and including a '?'.
+QUESTION_RE = re.compile(r'[^?\n]+\?')
+
+# A solution ends at the next boundary or at the first blank line.
+BLANK_LINE_RE = re.compile(r'\n[ \t]*$', re.MULTILINE)
+LEADING_SPACE_RE = re.compile(r'\s*')
+
+def scan(text, include_direct=False):
+    """Yield a match dict for every question in text, in document order.
+
+    Each match has 'rule', 'question', 'solution', 'start' and 'end', where
+    start/end delimit the whole question-plus-solution span in text.
+    """
+    boundary_re = DIRECT_BOUNDARY_RE if include_direct else BOUNDARY_RE
+    boundaries = list(boundary_re.finditer(text))
+
+    for index, boundary in enumerate(boundaries):
+        limit = boundaries[index + 1].start() if index + 1 < len(boundaries) else len(text)
+        # The question may sit on the line after a bare marker ("2.\nIf ...?"), even
+        # when that line is itself a boundary; merge_overlapping() resolves the overlap.
+        # A numbered marker that has a question of its own ("1.\n2. What ...?") keeps it.
+        question = QUESTION_RE.match(text, boundary.end())
+        if not question:
+            continue
+        if question.end() > limit:
+            following = boundaries[index + 1]
+            if following.lastgroup != 'direct' and QUESTION_RE.match(text, following.end()):
+                continue
+
+        solution_start = solution_end = question.end()
+        if solution_start < limit:
+            solution_start = LEADING_SPACE_RE.match(text, solution_start, limit).end()
+            blank_line = BLANK_LINE_RE.search(text, solution_start, limit)
+            solution_end = blank_line.start() if blank_line else limit
+
+        yield {
+            'rule': boundary.lastgroup,
+            'question': text[boundary.start():question.end()].strip(),
+            'solution': text[solution_start:solution_end].strip(),
+            'start': boundary.start(),
+            'end': solution_end,
+        }
+
+def merge_overlapping(matches):
+    """Collapse matches whose spans overlap or nest into one match per region.
+
+    Spans are sorted once by (start, -end) and swept left to right, so this is
+    O(n log n). The earliest, widest match of each overlapping group is kept.
+    """
+    merged = []
+    group_end = -1
+    for match in sorted(matches, key=lambda m: (m['start'], -m['end'])):
+        if match['start'] < group_end:
+            group_end = max(group_end, match['end'])
+            continue
+        merged.append(match)
+        group_end = match['end']
+    return merged
@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+"""
+Build the static full-text search for the problem pages.
+
+Every problem page under Physics/, Maths/ and chemistry/ is tokenized from its
+title, question, formulas and background-concept topics into an inverted
+index. Postings are sharded by the first PREFIX_LENGTH characters of each term
+into small JSON files under search/shards, so search/index.html only fetches
+the shards the words of a query fall into.
+"""
+
+import argparse
+import html
+import json
+import re
+from pathlib import Path
+from page_writer import write_page
+
+SUBJECT_DIRS = {'physics': Path("Physics"), 'maths': Path("Maths"), 'chemistry': Path("chemistry")}
+SEARCH_DIR = Path("search")
+PREFIX_LENGTH = 2
+SNIPPET_LENGTH = 160
+
+# Field weights: a word in the title says more about a problem than one in its question.
+FIELD_WEIGHTS = {'title': 3, 'topics': 2, 'question': 1, 'formulas': 1}
+
+STOPWORDS = sorted({
+    'a', 'an', 'and', 'are', 'as', 'at', 'be', 'by', 'for', 'from', 'if', 'in', 'is', 'it',
+    'its', 'of', 'on', 'or', 'that', 'the', 'this', 'to', 'what', 'which', 'with',
+})
+
+TITLE_RE = re.compile(r'<title>(?:Ch \S+ Problem \S+ — )?(.*?)</title>', re.DOTALL)
+QUESTION_RE = re.compile(r'<div class="panel q">\s*<h2>.*?</h2>(.*?)</div>', re.DOTALL)
+FORMULA_RE = re.compile(r'<div class="formula">(.*?)</div>', re.DOTALL)
+TOPIC_RE = re.compile(r'Background Concept — (.*?)</h2>', re.DOTALL)
+TAG_RE = re.compile(r'<[^>]+>')
+SPACE_RE = re.compile(r'\s+')
+WORD_RE = re.compile(r'\w+')
+SHARD_NAME_RE = re.compile(r'^[a-z0-9]+$')
+
+def plain_text(markup):
+    """Strip tags and entities and collapse whitespace."""
+    return SPACE_RE.sub(' ', html.unescape(TAG_RE.sub(' ', markup))).strip()
+
+def tokenize(text):
+    """Split text into lower-case index terms; search/index.html mirrors this."""
+    stopwords = set(STOPWORDS)
+    return [word for word in WORD_RE.findall(text.lower()) if len(word) > 1 and word not in stopwords]
+
+def shard_name(term):
+    """Return the shard a term lives in: its prefix, hex-encoded unless plain ASCII."""
+    prefix = term[:PREFIX_LENGTH]
+    if SHARD_NAME_RE.match(prefix):
+        return prefix
+    return "_" + "-".join(f"{ord(char):x}" for char in prefix)
+
+def iter_problem_pages():
+    """Yield (subject, path) for every problem page on the site, in chapter order."""
+    for subject, directory in SUBJECT_DIRS.items():
+        for path in sorted(directory.glob("ch*/problem-*.html")):
+            yield subject, path
+
+def read_page_fields(path):
+    """Extract the searchable fields of a problem page."""
+    markup = path.read_text(encoding='utf-8')
+    title = TITLE_RE.search(markup)
+    question = QUESTION_RE.search(markup)
+    return {
+        'title': plain_text(title.group(1)) if title else path.stem,
+        'question': plain_text(question.group(1)) if question else "",
+        'formulas': " ".join(plain_text(formula) for formula in FORMULA_RE.findall(markup)),
+        'topics': " ".join(plain_text(topic) for topic in TOPIC_RE.findall(markup)),
+    }
+
+def build_index(pages):
+    """Return (docs, postings) where postings maps term -> {doc number: score}."""
+    docs = []
+    postings = {}
+    for subject, path in pages:
+        fields = read_page_fields(path)
+        doc = len(docs)
+        docs.append([path.as_posix(), subject, fields['title'], fields['question'][:SNIPPET_LENGTH]])
+        for field, weight in FIELD_WEIGHTS.items():
+            for term in tokenize(fields[field]):
+                scores = postings.setdefault(term, {})
+                scores[doc] = scores.get(doc, 0) + weight
+    return docs, postings
+
+def write_search_index(out_dir=SEARCH_DIR):
+    """Write the document table, shards and search page; return (doc count, term count, shard count)."""
+    docs, postings = build_index(iter_problem_pages())
+
+    shards = {}
+    for term in sorted(postings):
+        # Postings are flattened to [doc, score, doc, score, ...], best first.
+        ranked = sorted(postings[term].items(), key=lambda item: (-item[1], item[0]))
+        shards.setdefault(shard_name(term), {})[term] = [value for posting in ranked for value in posting]
+
+    shard_dir = out_dir / "shards"
+    for name, terms in shards.items():
+        write_page(shard_dir / f"{name}.json", json.dumps(terms, ensure_ascii=False, separators=(',', ':')))
+    for stale in shard_dir.glob("*.json"):
+        if stale.stem not in shards:
+            stale.unlink()
+
+    meta = {'prefix_length': PREFIX_LENGTH, 'stopwords': STOPWORDS, 'shards': sorted(shards)}
+    write_page(out_dir / "meta.json", json.dumps(meta, separators=(',', ':')))
+    write_page(out_dir / "docs.json", json.dumps(docs, ensure_ascii=False, separators=(',', ':')))
+    write_page(out_dir / "index.html", SEARCH_PAGE)
+    return len(docs), len(postings), len(shards)
+
+SEARCH_PAGE = """<!DOCTYPE html>
+<html lang="en">
+<head>
+  <meta charset="utf-8" />
+  <meta name="viewport" content="width=device-width, initial-scale=1" />
+  <title>Search Problems</title>
+  <style>
+    body { font-family: ui-sans-serif, system-ui, -apple-system, Segoe UI, Roboto, Helvetica, Arial; margin: 24px; line-height: 1.55; }
+    h1 { color: #0ea5e9; margin: 0 0 12px; }
+    input { width: 100%; max-width: 640px; font-size: 18px; padding: 8px 10px; border: 1px solid #e5e7eb; border-radius: 8px; }
+    .muted { color: #374151; }
+    ul { margin: 12px 0 0 20px; padding: 0; }
+    li { margin: 10px 0; }
+    a { color: #2563eb; text-decoration: none; }
+    a:hover { text-decoration: underline; }
+    .source { font-size: 0.9em; color: #6b7280; margin-left: 8px; }
+    .snippet { display: block; font-size: 0.9em; color: #374151; }
+  </style>
+</head>
+<body>
+  <p><a href="../">← Back to Main Index</a></p>
+  <h1>Search Problems</h1>
+  <input id="q" type="search" placeholder="e.g. projectile range, Nernst equation, inverse function" autofocus />
+  <p id="status" class="muted"></p>
+  <ul id="results"></ul>
+  <script>
+    const MAX_RESULTS = 50;
+    const shardCache = {};
+    let meta = null, docs = null;
+
+    function fetchJSON(url) {
+      return fetch(url).then(response => response.json());
+    }
+
+    function tokenize(text) {
+      const words = text.toLowerCase().match(/[\\p{L}\\p{N}_]+/gu) || [];
+      return words.filter(word => word.length > 1 && !meta.stopwords.includes(word));
+    }
+
+    function shardName(term) {
+      const prefix = Array.from(term).slice(0, meta.prefix_length).join('');
+      if (/^[a-z0-9]+$/.test(prefix)) return prefix;
+      return '_' + Array.from(prefix).map(char => char.codePointAt(0).toString(16)).join('-');
+    }
+
+    function loadShard(name) {
+      if (!meta.shards.includes(name)) return Promise.resolve({});
+      if (!shardCache[name]) shardCache[name] = fetchJSON(`shards/${name}.json`);
+      return shardCache[name];
+    }
+
+    // Scores of every document matching a query word; the word may be the
+    // start of a longer term, so that results appear while typing.
+    async function scoreWord(word) {
+      const shard = await loadShard(shardName(word));
+      const scores = new Map();
+      for (const [term, postings] of Object.entries(shard)) {
+        if (!term.startsWith(word)) continue;
+        const weight = term === word ? 1 : 0.5;
+        for (let i = 0; i < postings.length; i += 2) {
+          scores.set(postings[i], (scores.get(postings[i]) || 0) + postings[i + 1] * weight);
+        }
+      }
+      return scores;
+    }
+
+    async function search(query) {
+      const words = tokenize(query);
+      if (!words.length) return null;
+      const perWord = await Promise.all(words.map(scoreWord));
+      let total = perWord[0];
+      for (const scores of perWord.slice(1)) {
+        const next = new Map();
+        for (const [doc, score] of total) {
+          if (scores.has(doc)) next.set(doc, score + scores.get(doc));
+        }
+        total = next;
+      }
+      return Array.from(total).sort((a, b) => b[1] - a[1] || a[0] - b[0]);
+    }
+
+    function render(ranked) {
+      const results = document.getElementById('results');
+      const status = document.getElementById('status');
+      results.innerHTML = '';
+      if (ranked === null) { status.textContent = ''; return; }
+      status.textContent = `${ranked.length} matching problem${ranked.length === 1 ? '' : 's'}`;
+      for (const [doc] of ranked.slice(0, MAX_RESULTS)) {
+        const [href, subject, title, snippet] = docs[doc];
+        const item = document.createElement('li');
+        const link = document.createElement('a');
+        link.href = `../${href}`;
+        link.textContent = title;
+        const source = document.createElement('span');
+        source.className = 'source';
+        source.textContent = `${subject} · ${href.split('/').pop().replace('.html', '')}`;
+        const text = document.createElement('span');
+        text.className = 'snippet';
+        text.textContent = snippet;
+        item.append(link, source, text);
+        results.append(item);
+      }
+    }
+
+    let pending = 0;
+    async function onInput() {
+      const query = document.getElementById('q').value;
+      const ticket = ++pending;
+      if (!meta) [meta, docs] = await Promise.all([fetchJSON('meta.json'), fetchJSON('docs.json')]);
+      const ranked = await search(query);
+      if (ticket === pending) render(ranked);
+    }
+
+    const input = document.getElementById('q');
+    input.addEventListener('input', onInput);
+    const initial = new URLSearchParams(location.search).get('q');
+    if (initial) { input.value = initial; onInput(); }
+  </script>
+</body>
+</html>
+"""
+
+def main():
+    """Rebuild the search index from the problem pages on disk."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('-o', '--output', type=Path, default=SEARCH_DIR, help='directory to write the index to')
+    args = parser.parse_args()
+
+    doc_count, term_count, shard_count = write_search_index(args.output)
+    print(f"Indexed {doc_count} problems: {term_count} terms in {shard_count} shards under {args.output}")
+
+if __name__ == "__main__":
+    main()
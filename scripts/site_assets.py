@@ -0,0 +1,50 @@
+"""
+Shared stylesheet for the generated problem pages.
+
+Every problem page links to one fingerprinted assets/problem.<hash>.css instead
+of inlining its own <style> block. The hash changes whenever the CSS does, so
+the Pages site can let browsers cache the file indefinitely.
+"""
+
+import hashlib
+from pathlib import Path
+from page_writer import write_page
+
+ASSETS_DIR = Path("assets")
+
+# The union of the style blocks the generators used to inline.
+PROBLEM_CSS = """\
+body { margin:0; font-family: ui-sans-serif, system-ui, -apple-system, Segoe UI, Roboto, Helvetica, Arial; background:#ffffff; color:#111827; line-height:1.55; }
+.container { max-width: 960px; margin:0 auto; padding:24px; }
+h1 { margin:0 0 8px; font-size:26px; color:#38bdf8; }
+h2 { margin:18px 0 8px; font-size:20px; color:#a78bfa; }
+h3 { margin:16px 0 6px; font-size:18px; color:#7c3aed; }
+.panel { background:#ffffff; border:1px solid #e5e7eb; border-radius:10px; padding:16px; margin:16px 0; }
+.q { border-left:3px solid #f59e0b; padding-left:10px; }
+.solution { border-left:3px solid #10b981; padding-left:10px; background:#f0fdf4; }
+.concept-section { background:#f8fafc; border:1px solid #e2e8f0; border-radius:8px; padding:12px; margin:12px 0; }
+.physics-diagram, .math-diagram, .chemistry-diagram { max-width:100%; height:auto; display:block; margin:12px auto; border:1px solid #e5e7eb; border-radius:8px; background:#fafafa; }
+code { background:#f8fafc; border:1px solid #e5e7eb; padding:2px 6px; border-radius:6px; font-family: 'Courier New', monospace; }
+.muted { color:#374151; }
+ul { margin:8px 0 8px 20px; }
+li { margin:4px 0; }
+.formula { background:#fef3c7; border:1px solid #f59e0b; border-radius:6px; padding:8px; margin:8px 0; text-align:center; font-family: 'Courier New', monospace; }
+.highlight { background:#fef3c7; padding:2px 4px; border-radius:4px; }
+"""
+
+PROBLEM_CSS_NAME = f"problem.{hashlib.sha256(PROBLEM_CSS.encode('utf-8')).hexdigest()[:10]}.css"
+
+# Problem pages live two levels below the site root, e.g. Physics/ch1/.
+PROBLEM_STYLESHEET = f'<link rel="stylesheet" href="../../{ASSETS_DIR.as_posix()}/{PROBLEM_CSS_NAME}" />'
+
+def write_stylesheet():
+    """Write the fingerprinted problem stylesheet if it is not already there; return its path.
+
+    Stylesheets left behind by earlier versions of the CSS are removed.
+    """
+    path = ASSETS_DIR / PROBLEM_CSS_NAME
+    write_page(path, PROBLEM_CSS)
+    for stale in ASSETS_DIR.glob("problem.*.css"):
+        if stale.name != PROBLEM_CSS_NAME:
+            stale.unlink()
+    return path
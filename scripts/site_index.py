@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+"""
+Build the subject index pages from a manifest of the generated problem pages.
+
+Every ch*/problem-*.html page under Physics/, Maths/ and chemistry/ becomes a
+manifest entry: its chapter, number, title and source, read from the page.
+The manifest is kept in .cache/index-manifest.json together with each page's
+size and mtime, so only new or touched pages are read again. Each chapter's
+section of the subject's landing page is cached there too, keyed by the hash
+of its entries, and a chapter is only rendered again when that hash changes.
+
+The landing page lists the first PREVIEW_SIZE problems of each chapter and
+links to the chapter's own index, ch<N>/index.html, which is split into pages of
+PAGE_SIZE problems (index.html, index-2.html, ...), so a large chapter does not
+make one huge landing page.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+from pathlib import Path
+from page_writer import write_page
+from problem_store import iter_problems
+
+SUBJECT_DIRS = {'physics': Path("Physics"), 'maths': Path("Maths"), 'chemistry': Path("chemistry")}
+SUBJECT_NAMES = {'physics': "Physics", 'maths': "Maths", 'chemistry': "Chemistry"}
+MANIFEST_PATH = Path(os.environ.get("INDEX_MANIFEST", ".cache/index-manifest.json"))
+
+# Bump whenever the entries or the rendered markup change so cached sections are ignored.
+MANIFEST_VERSION = 1
+PREVIEW_SIZE = 10
+PAGE_SIZE = 50
+
+PAGE_NAME_RE = re.compile(r'problem-(\d+)-(\d+)\.html$')
+TITLE_RE = re.compile(r'<title>(?:Ch \S+ Problem \S+ — )?(.*?)</title>', re.DOTALL)
+CHAPTER_TITLE_RE = re.compile(r'<h1>(.*?) · Problem')
+SOURCE_RE = re.compile(r'Board \d{4}')
+
+STYLE = """    body { font-family: ui-sans-serif, system-ui, -apple-system, Segoe UI, Roboto, Helvetica, Arial; margin: 24px; line-height: 1.55; }
+    h1 { color: #0ea5e9; margin: 0 0 12px; }
+    h2 { color: #7c3aed; margin: 24px 0 12px; }
+    .muted { color: #374151; }
+    ul { margin: 12px 0 0 20px; }
+    a { color: #2563eb; text-decoration: none; }
+    a:hover { text-decoration: underline; }
+    .source { font-size: 0.9em; color: #6b7280; margin-left: 8px; }
+    .pages a { margin-right: 8px; }"""
+
+def read_entry(path):
+    """Read a problem page's manifest entry: chapter, number, title, source and chapter title."""
+    text = path.read_text(encoding='utf-8')
+    chapter, num = (int(group) for group in PAGE_NAME_RE.search(path.name).groups())
+    title = TITLE_RE.search(text)
+    chapter_title = CHAPTER_TITLE_RE.search(text)
+    source = SOURCE_RE.search(text)
+    return {
+        'chapter': chapter,
+        'num': num,
+        'title': title.group(1).strip() if title else "",
+        # Pages rendered from the store say "Chapter N" here; only a real name is kept.
+        'chapter_title': chapter_title.group(1) if chapter_title and not chapter_title.group(1).startswith("Chapter ") else None,
+        'source': source.group(0) if source else None,
+    }
+
+def scan_pages(site_dir, previous):
+    """Return {href: entry} for a subject's problem pages, reusing previous entries of untouched pages."""
+    pages = {}
+    for path in sorted(site_dir.glob("ch*/problem-*.html")):
+        if not PAGE_NAME_RE.search(path.name):
+            continue
+        href = path.relative_to(site_dir).as_posix()
+        stat = path.stat()
+        entry = previous.get(href)
+        if entry is None or entry['size'] != stat.st_size or entry['mtime'] != stat.st_mtime_ns:
+            entry = dict(read_entry(path), size=stat.st_size, mtime=stat.st_mtime_ns)
+        pages[href] = entry
+    return pages
+
+def chapter_titles(subject):
+    """Return {chapter: title} from the problem store."""
+    return {record['chapter']: record['chapter_title'] for record in iter_problems(subject)}
+
+def entry_item(entry, href):
+    """Render one problem's list item."""
+    label = f"Problem {entry['chapter']}.{entry['num']}"
+    if entry['title']:
+        label += f": {entry['title']}"
+    source = f'<span class="source">{entry["source"]}</span>' if entry['source'] else ""
+    return f'    <li><a href="{href}">{label}</a>{source}</li>'
+
+def page_name(page):
+    """Return the file name of a chapter index page, numbered from 1."""
+    return "index.html" if page == 1 else f"index-{page}.html"
+
+def render_section(chapter, heading, entries):
+    """Render a chapter's section of the landing page."""
+    lines = [f"  <h2>{heading}</h2>", "  <ul>"]
+    lines += [entry_item(entry, f"./{href}") for href, entry in entries[:PREVIEW_SIZE]]
+    lines.append("  </ul>")
+    lines.append(f'  <p><a href="./ch{chapter}/">All {len(entries)} problems in chapter {chapter} →</a></p>')
+    return "\n".join(lines) + "\n"
+
+def render_page(title, body):
+    """Wrap body markup in the index page shell."""
+    return f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+  <meta charset="utf-8" />
+  <meta name="viewport" content="width=device-width, initial-scale=1" />
+  <title>{title}</title>
+  <style>
+{STYLE}
+  </style>
+</head>
+<body>
+{body}</body>
+</html>
+"""
+
+def render_chapter_pages(subject, chapter, heading, entries):
+    """Render a chapter's paginated index; return [(file name, html)]."""
+    page_count = max(1, -(-len(entries) // PAGE_SIZE))
+    pages = []
+    for page in range(1, page_count + 1):
+        chunk = entries[(page - 1) * PAGE_SIZE:page * PAGE_SIZE]
+        links = " ".join(f"<strong>{number}</strong>" if number == page else f'<a href="./{page_name(number)}">{number}</a>'
+                         for number in range(1, page_count + 1))
+        body = [f"  <h1>{SUBJECT_NAMES[subject]} · {heading}</h1>",
+                f'  <p><a href="../">← Back to {SUBJECT_NAMES[subject]} Index</a></p>',
+                "  <ul>"]
+        # Pages live one level down, in the chapter directory, so links drop the ch<N>/ prefix.
+        body += [entry_item(entry, f"./{href.split('/', 1)[1]}") for href, entry in chunk]
+        body.append("  </ul>")
+        if page_count > 1:
+            body.append(f'  <p class="pages">Page {links}</p>')
+        title = f"{SUBJECT_NAMES[subject]} · Chapter {chapter}" + (f" · Page {page}" if page > 1 else "")
+        pages.append((page_name(page), render_page(title, "\n".join(body) + "\n")))
+    return pages
+
+def update_subject_index(subject, state, force=False):
+    """Bring a subject's landing page and chapter indexes up to date; return (pages, chapters rendered)."""
+    site_dir = SUBJECT_DIRS[subject]
+    pages = scan_pages(site_dir, state.get('pages', {}))
+    by_chapter = {}
+    for href, entry in sorted(pages.items(), key=lambda item: (item[1]['chapter'], item[1]['num'])):
+        by_chapter.setdefault(entry['chapter'], []).append((href, entry))
+
+    titles = chapter_titles(subject)
+    old_chapters = state.get('chapters', {})
+    chapters = {}
+    rendered = 0
+    for chapter, entries in by_chapter.items():
+        chapter_title = titles.get(chapter) or next(
+            (entry['chapter_title'] for _, entry in entries if entry['chapter_title']), None)
+        heading = f"Chapter {chapter} - {chapter_title}" if chapter_title else f"Chapter {chapter}"
+        listed = [(href, {key: entry[key] for key in ('num', 'title', 'source')}) for href, entry in entries]
+        key = hashlib.sha256(json.dumps([heading, PREVIEW_SIZE, PAGE_SIZE, listed], ensure_ascii=False).encode('utf-8')).hexdigest()
+
+        chapter_dir = site_dir / f"ch{chapter}"
+        cached = old_chapters.get(str(chapter))
+        if not force and cached and cached['hash'] == key and (chapter_dir / "index.html").exists():
+            chapters[str(chapter)] = cached
+            continue
+        chapter_pages = dict(render_chapter_pages(subject, chapter, heading, entries))
+        for file_name, page_html in chapter_pages.items():
+            write_page(chapter_dir / file_name, page_html)
+        # A chapter that shrank leaves index-N.html pages behind.
+        for stale in chapter_dir.glob("index-*.html"):
+            if stale.name not in chapter_pages:
+                stale.unlink()
+        chapters[str(chapter)] = {'hash': key, 'section': render_section(chapter, heading, entries)}
+        rendered += 1
+    for chapter in set(old_chapters) - set(chapters):
+        # Every problem page of the chapter is gone; so is its index.
+        for stale in (site_dir / f"ch{chapter}").glob("index*.html"):
+            stale.unlink()
+
+    name = SUBJECT_NAMES[subject]
+    body = [f"  <h1>{name} · Questions Index</h1>",
+            '  <p class="muted">Browse all problems, grouped by chapter.</p>',
+            '  <p><a href="../">← Back to Main Index</a></p>',
+            ""]
+    body += [chapters[str(chapter)]['section'] for chapter in by_chapter]
+    body.append(f'  <p class="muted">Total: {len(pages)} problems in {len(by_chapter)} chapters</p>')
+    write_page(site_dir / "index.html", render_page(f"{name} · Questions Index", "\n".join(body) + "\n"))
+
+    state['pages'], state['chapters'] = pages, chapters
+    return len(pages), rendered
+
+def load_manifest():
+    """Load the manifest written by the previous run, or an empty one."""
+    if not MANIFEST_PATH.exists():
+        return {}
+    try:
+        with open(MANIFEST_PATH, encoding='utf-8') as f:
+            manifest = json.load(f)
+    except ValueError as e:
+        print(f"Ignoring unreadable index manifest {MANIFEST_PATH}: {e}")
+        return {}
+    return manifest if manifest.get('version') == MANIFEST_VERSION else {}
+
+def save_manifest(manifest):
+    """Write the manifest atomically."""
+    MANIFEST_PATH.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = MANIFEST_PATH.with_name(f"{MANIFEST_PATH.name}.{os.getpid()}.tmp")
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(dict(manifest, version=MANIFEST_VERSION), f, ensure_ascii=False, sort_keys=True)
+    os.replace(tmp_path, MANIFEST_PATH)
+
+def write_site_indexes(subjects=None, force=False):
+    """Update the index pages of the given subjects (default: all); return {subject: (pages, chapters rendered)}."""
+    manifest = load_manifest()
+    subject_states = manifest.setdefault('subjects', {})
+    results = {}
+    for subject in subjects or SUBJECT_DIRS:
+        results[subject] = update_subject_index(subject, subject_states.setdefault(subject, {}), force)
+    save_manifest(manifest)
+    return results
+
+def main():
+    """Update the subject indexes and report what was rendered."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('subjects', nargs='*', metavar='subject',
+                        help='only index these subjects (physics, maths, chemistry)')
+    parser.add_argument('-f', '--force', action='store_true', help='render every chapter again')
+    args = parser.parse_args()
+    unknown = set(args.subjects) - set(SUBJECT_DIRS)
+    if unknown:
+        parser.error(f"unknown subject: {', '.join(sorted(unknown))}")
+    for subject, (pages, rendered) in write_site_indexes(args.subjects, args.force).items():
+        print(f"{SUBJECT_DIRS[subject] / 'index.html'}: {pages} problems, {rendered} chapters rendered")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Deduplicate problem diagrams into a shared SVG sprite sheet.
+
+Each diagram is split into its graphics (shapes, paths, markers) and its text
+labels. The graphics become a <symbol> in assets/<sheet>.svg, keyed by a hash
+of their content, so diagrams drawn from the same template share one symbol.
+Pages keep only a small <svg> that <use>s the symbol and carries its own labels.
+"""
+
+import argparse
+import hashlib
+import re
+from pathlib import Path
+from page_writer import write_page
+from problem_store import iter_problems
+from site_assets import ASSETS_DIR
+
+STORE_SHEET = "diagrams.svg"
+
+SVG_RE = re.compile(r'^\s*<svg\b([^>]*)>(.*)</svg>\s*$', re.DOTALL)
+TEXT_RE = re.compile(r'<text\b.*?</text>', re.DOTALL)
+VIEWBOX_RE = re.compile(r'\bviewBox="[^"]*"')
+ID_RE = re.compile(r'\bid="([^"]+)"')
+BETWEEN_TAGS_RE = re.compile(r'>\s+<')
+
+def normalize(markup):
+    """Collapse the whitespace between tags."""
+    return BETWEEN_TAGS_RE.sub('><', markup).strip()
+
+def split_svg(svg):
+    """Split a diagram into (svg attributes, graphics, text labels), or None if it has no graphics."""
+    match = SVG_RE.match(svg)
+    if not match:
+        return None
+    attributes, body = match.groups()
+    texts = "".join(normalize(text) for text in TEXT_RE.findall(body))
+    graphics = normalize(TEXT_RE.sub('', body))
+    if not graphics:
+        return None
+    return attributes, graphics, texts
+
+def symbol_id(attributes, graphics):
+    """Return the content-addressed id of a diagram's symbol."""
+    view_box = VIEWBOX_RE.search(attributes)
+    key = (view_box.group(0) if view_box else "") + graphics
+    return "d-" + hashlib.sha256(key.encode('utf-8')).hexdigest()[:10]
+
+def symbol_markup(attributes, graphics):
+    """Return the <symbol> element for a diagram's graphics."""
+    sid = symbol_id(attributes, graphics)
+    # Prefix ids defined inside the diagram (markers, gradients) so that
+    # symbols from different diagrams cannot collide within the sheet.
+    for local_id in ID_RE.findall(graphics):
+        graphics = graphics.replace(f'id="{local_id}"', f'id="{sid}-{local_id}"')
+        graphics = graphics.replace(f'url(#{local_id})', f'url(#{sid}-{local_id})')
+    view_box = VIEWBOX_RE.search(attributes)
+    return f'<symbol id="{sid}"{" " + view_box.group(0) if view_box else ""}>{graphics}</symbol>'
+
+def sprite_reference(svg, sheet=STORE_SHEET):
+    """Return the page markup that draws a diagram from the sprite sheet.
+
+    Diagrams without graphics, or that cannot be parsed, are returned unchanged.
+    """
+    parts = split_svg(svg) if svg else None
+    if parts is None:
+        return svg
+    attributes, graphics, texts = parts
+    # Problem pages live two levels below the site root, e.g. Physics/ch1/.
+    href = f"../../{ASSETS_DIR.as_posix()}/{sheet}#{symbol_id(attributes, graphics)}"
+    return f'<svg{attributes}><use href="{href}"/>{texts}</svg>'
+
+def write_sprite_sheet(svgs, sheet=STORE_SHEET):
+    """Write one symbol per unique diagram in svgs to assets/<sheet>; return (path, symbol count)."""
+    symbols = {}
+    for svg in svgs:
+        parts = split_svg(svg) if svg else None
+        if parts is not None:
+            attributes, graphics, _ = parts
+            symbols.setdefault(symbol_id(attributes, graphics), symbol_markup(attributes, graphics))
+
+    path = ASSETS_DIR / sheet
+    content = '<svg xmlns="http://www.w3.org/2000/svg">\n'
+    content += "".join(f"{symbols[sid]}\n" for sid in sorted(symbols))
+    content += "</svg>\n"
+    write_page(path, content)
+    return path, len(symbols)
+
+def write_store_sprite_sheet():
+    """Write the sprite sheet for every diagram in the problem store."""
+    return write_sprite_sheet(problem.get('svg') for problem in iter_problems())
+
+def main():
+    """Write the store's sprite sheet and report the bytes saved."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.parse_args()
+
+    svgs = [problem['svg'] for problem in iter_problems() if problem.get('svg')]
+    path, count = write_store_sprite_sheet()
+    inline_bytes = sum(len(svg.encode('utf-8')) for svg in svgs)
+    referenced_bytes = sum(len(sprite_reference(svg).encode('utf-8')) for svg in svgs)
+    sheet_bytes = Path(path).stat().st_size
+    print(f"{len(svgs)} diagrams share {count} symbols in {path}")
+    print(f"Inline: {inline_bytes / 1024:.1f} KB; with sprite: {referenced_bytes / 1024:.1f} KB in pages "
+          f"+ {sheet_bytes / 1024:.1f} KB sheet")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Aho-Corasick keyword matching for picking the topics a question is about.
+
+A topic such as 'projectile motion' matches wherever any of its words occurs
+in the question, the same substring test the extractors used to run keyword
+by keyword. Here every keyword of every topic is compiled once into a single
+automaton, and one pass over the question counts all of their occurrences, so
+the cost per question no longer grows with the size of the topic vocabulary.
+"""
+
+from collections import deque
+from functools import lru_cache
+
+def build_automaton(keywords):
+    """Build the goto/fail/output tables of an Aho-Corasick automaton.
+
+    Returns (goto, fail, output): goto[state] maps a character to the next
+    state, fail[state] is the fallback state, and output[state] lists the
+    indices of the keywords that end at that state.
+    """
+    goto, fail, output = [{}], [0], [[]]
+    for index, keyword in enumerate(keywords):
+        state = 0
+        for char in keyword:
+            if char not in goto[state]:
+                goto.append({})
+                fail.append(0)
+                output.append([])
+                goto[state][char] = len(goto) - 1
+            state = goto[state][char]
+        output[state].append(index)
+
+    queue = deque(goto[0].values())
+    while queue:
+        state = queue.popleft()
+        for char, child in goto[state].items():
+            queue.append(child)
+            fallback = fail[state]
+            while fallback and char not in goto[fallback]:
+                fallback = fail[fallback]
+            fail[child] = goto[fallback].get(char, 0)
+            output[child] = output[child] + output[fail[child]]
+    return goto, fail, output
+
+def count_keywords(automaton, text):
+    """Return {keyword index: number of (possibly overlapping) occurrences in text}."""
+    goto, fail, output = automaton
+    counts = {}
+    state = 0
+    for char in text:
+        while state and char not in goto[state]:
+            state = fail[state]
+        state = goto[state].get(char, 0)
+        for index in output[state]:
+            counts[index] = counts.get(index, 0) + 1
+    return counts
+
+@lru_cache(maxsize=None)
+def topic_matcher(topics):
+    """Compile a tuple of topics into a matcher, once per distinct tuple."""
+    keywords = sorted({keyword for topic in topics for keyword in topic.lower().split()})
+    keyword_index = {keyword: index for index, keyword in enumerate(keywords)}
+    topic_keywords = [(topic, [keyword_index[keyword] for keyword in set(topic.lower().split())])
+                      for topic in topics]
+    return build_automaton(keywords), topic_keywords
+
+def rank_topics(topics, text):
+    """Return [(topic, count)] for the topics mentioned in text, most mentioned first.
+
+    A topic's count is the total number of occurrences of its words; ties keep
+    the order of topics.
+    """
+    automaton, topic_keywords = topic_matcher(tuple(topics))
+    counts = count_keywords(automaton, text.lower())
+    ranked = []
+    for topic, indices in topic_keywords:
+        count = sum(counts.get(index, 0) for index in indices)
+        if count:
+            ranked.append((topic, count))
+    ranked.sort(key=lambda item: -item[1])
+    return ranked
@@ -0,0 +1,13 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+from extract_math_questions import extract_questions_from_text
+
+def test_question_continues_across_page_break():
+    pages = [(1, "Some intro text here\n2.\n"), (2, "If x = 1, what is y?\nMore text")]
+    questions = list(extract_questions_from_text(pages, "t.pdf"))
+    assert [(q['page'], q['rule']) for q in questions] == [(1, 'exercise')]
+    assert questions[0]['text'].startswith("2.")
+    assert questions[0]['text'].endswith("If x = 1, what is y?")
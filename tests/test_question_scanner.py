@@ -0,0 +1,21 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+from answer_key import question_number
+from question_scanner import merge_overlapping, scan
+
+def test_bare_marker_does_not_claim_next_numbered_question():
+    text = "1.\n2. What is the domain of f(x) = 1/x?\nSolution: all reals except 0."
+    matches = merge_overlapping(scan(text))
+    assert len(matches) == 1
+    assert matches[0]['question'] == "2. What is the domain of f(x) = 1/x?"
+    assert matches[0]['solution'] == "Solution: all reals except 0."
+    assert question_number(matches[0]['question']) == 2
+
+def test_bare_marker_keeps_question_on_next_line():
+    matches = merge_overlapping(scan("2.\nIf x = 1, what is y?\nSolution: y = 2."))
+    assert len(matches) == 1
+    assert matches[0]['question'] == "2.\nIf x = 1, what is y?"
+    assert matches[0]['solution'] == "Solution: y = 2."